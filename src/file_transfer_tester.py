@@ -1,10 +1,14 @@
 """File transfer performance testing utilities for SMB, FTP, and HTTP protocols."""
 
+import functools
 import os
+import shutil
 import time
 import tempfile
+import threading
 import logging
 import statistics
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple, Union
 from pathlib import Path
 from datetime import datetime
@@ -13,6 +17,7 @@ import http.client
 import urllib.request
 import urllib.parse
 import socket
+import zlib
 
 # Optional dependencies - import with graceful fallback
 try:
@@ -28,6 +33,49 @@ from .models import FileTransferResult
 
 logger = logging.getLogger(__name__)
 
+# Repeating pattern for consistent test data, written in 64 KiB chunks so
+# creating a large file never holds the whole payload in memory
+_TEST_PATTERN = b'0123456789ABCDEF' * 4096
+
+# Without os.sendfile (e.g. on Windows), socket.sendfile falls back to
+# 8 KiB send() calls, which is slower than storbinary with large blocks
+_HAS_SENDFILE = hasattr(os, 'sendfile')
+
+# Bytes per megabyte, for file sizes and MB/s speeds
+_MB = 1024 * 1024
+
+# Chunk size for streaming transfers; large blocks amortize per-call
+# overhead and keep high-latency links busy
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _mb_to_bytes(size_mb: float) -> int:
+    """Convert a test file size in megabytes to bytes."""
+    return int(size_mb * _MB)
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_crc32(size_bytes: int) -> int:
+    """Return the CRC-32 of a test file of the given size."""
+    full_chunks, remainder = divmod(size_bytes, len(_TEST_PATTERN))
+    crc = 0
+    for _ in range(full_chunks):
+        crc = zlib.crc32(_TEST_PATTERN, crc)
+    return zlib.crc32(_TEST_PATTERN[:remainder], crc)
+
+
+def _file_crc32(file_path: str) -> int:
+    """Return the CRC-32 of a file, read in copy-buffer sized chunks."""
+    crc = 0
+    buffer = bytearray(_COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, 'rb', buffering=0) as f:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                return crc
+            crc = zlib.crc32(view[:count], crc)
+
 
 class FileTransferError(Exception):
     """Base exception for file transfer related errors."""
@@ -63,7 +111,17 @@ class FileTransferTester:
         self.timeout = timeout
         self.temp_dir = temp_dir or tempfile.gettempdir()
         self._created_files: List[str] = []
-        self._test_data_cache: Dict[int, bytes] = {}
+        # Canonical test file per size in bytes; later requests for the same
+        # size get a hard link (or copy) of it instead of rewriting the data
+        self._file_cache: Dict[int, str] = {}
+        # Idle keep-alive HTTP connections by (host, port, use_https); a
+        # connection is taken out while in use so parallel iterations never
+        # share one
+        self._http_pool: Dict[Tuple[str, int, bool], List[http.client.HTTPConnection]] = {}
+        # Writes local files while transfers connect; started on first use
+        # and shut down by cleanup()
+        self._file_executor: Optional[ThreadPoolExecutor] = None
+        self._file_executor_lock = threading.Lock()
         
     def create_test_file(self, size_mb: float) -> str:
         """
@@ -79,14 +137,19 @@ class FileTransferTester:
             FileTransferError: If file creation fails
         """
         try:
-            size_bytes = int(size_mb * 1024 * 1024)
+            size_bytes = _mb_to_bytes(size_mb)
+            
+            cached_file = self._file_cache.get(size_bytes)
+            if cached_file is not None:
+                file_path = self._clone_test_file(cached_file, size_mb)
+                if file_path is not None:
+                    self._created_files.append(file_path)
+                    logger.debug(f"Created test file: {file_path} ({size_mb} MB, reused)")
+                    return file_path
+                # Canonical file is gone; write a new one below
+                self._file_cache.pop(size_bytes, None)
             
-            # Generate test data if not cached
-            if size_bytes not in self._test_data_cache:
-                # Create repeating pattern for consistent data
-                pattern = b'0123456789ABCDEF' * 64  # 1KB pattern
-                chunks_needed = (size_bytes + len(pattern) - 1) // len(pattern)
-                self._test_data_cache[size_bytes] = (pattern * chunks_needed)[:size_bytes]
+            full_chunks, remainder = divmod(size_bytes, len(_TEST_PATTERN))
             
             # Create temporary file
             fd, file_path = tempfile.mkstemp(
@@ -96,24 +159,197 @@ class FileTransferTester:
             )
             
             try:
-                with os.fdopen(fd, 'wb') as f:
-                    f.write(self._test_data_cache[size_bytes])
+                f = os.fdopen(fd, 'wb')
+            except Exception:
+                os.close(fd)
+                os.unlink(file_path)
+                raise
+            
+            try:
+                # The file object owns fd from here on and closes it on exit
+                with f:
+                    # No fsync: the file is transient and is read back
+                    # through the page cache, so durability only adds latency
+                    for _ in range(full_chunks):
+                        f.write(_TEST_PATTERN)
+                    if remainder:
+                        f.write(_TEST_PATTERN[:remainder])
                     f.flush()
-                    os.fsync(f.fileno())  # Ensure data is written to disk
                 
                 self._created_files.append(file_path)
+                self._file_cache[size_bytes] = file_path
                 logger.debug(f"Created test file: {file_path} ({size_mb} MB)")
                 return file_path
                 
             except Exception:
-                os.close(fd)  # Close if still open
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
+                os.unlink(file_path)
                 raise
                 
         except Exception as e:
             raise FileTransferError(f"Failed to create test file: {e}")
     
+    def _clone_test_file(self, source: str, size_mb: float) -> Optional[str]:
+        """
+        Create a new test file path with the same content as an existing one.
+        
+        Hard links share the source's data blocks, so no payload is written;
+        when linking is not supported the file is copied instead.
+        
+        Args:
+            source: Path of the canonical test file
+            size_mb: File size in megabytes (used in the file name)
+            
+        Returns:
+            Optional[str]: Path to the new file, or None if the source is unusable
+        """
+        # os.link never replaces an existing path, so a name collision just
+        # falls through to the copy below
+        file_path = tempfile.mktemp(
+            suffix='.dat',
+            prefix=f'test_{size_mb}MB_',
+            dir=self.temp_dir
+        )
+        try:
+            os.link(source, file_path)
+            return file_path
+        except OSError:
+            pass
+        
+        fd, file_path = tempfile.mkstemp(
+            suffix='.dat',
+            prefix=f'test_{size_mb}MB_',
+            dir=self.temp_dir
+        )
+        os.close(fd)
+        try:
+            # copyfile uses the platform's in-kernel copy (sendfile on Linux,
+            # fcopyfile on macOS) instead of a user-space read/write loop
+            shutil.copyfile(source, file_path)
+        except OSError:
+            os.unlink(file_path)
+            return None
+        
+        return file_path
+    
+    def _create_download_file(self, file_size_mb: float) -> str:
+        """
+        Create the local destination file for a download.
+        
+        The file is preallocated to the expected size where the platform
+        supports it, so the filesystem does not extend it block by block
+        during the timed transfer. Downloads open it with 'r+b' and truncate
+        it to the bytes actually received.
+        
+        Args:
+            file_size_mb: Expected file size in megabytes
+            
+        Returns:
+            str: Path to the destination file
+        """
+        fd, file_path = tempfile.mkstemp(
+            suffix='.dat',
+            prefix=f'download_{file_size_mb}MB_',
+            dir=self.temp_dir
+        )
+        self._created_files.append(file_path)
+        try:
+            size_bytes = _mb_to_bytes(file_size_mb)
+            if size_bytes > 0 and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, size_bytes)
+                except OSError as e:
+                    logger.debug(f"Could not preallocate {file_path}: {e}")
+        finally:
+            os.close(fd)
+        
+        return file_path
+    
+    def _prepare_local_file(self, direction: str, file_size_mb: float) -> Future:
+        """
+        Start creating the local file for a transfer on a background thread.
+        
+        Writing the file overlaps with connection setup; callers take the path
+        from the returned future just before the transfer is timed.
+        
+        Args:
+            direction: "upload" or "download" (already lower-cased)
+            file_size_mb: File size in megabytes
+            
+        Returns:
+            Future: Resolves to the local file path
+        """
+        if direction == "upload":
+            create = self.create_test_file
+        elif direction == "download":
+            create = self._create_download_file
+        else:
+            raise ValueError(f"Invalid direction: {direction}. Must be 'upload' or 'download'")
+        
+        with self._file_executor_lock:
+            if self._file_executor is None:
+                self._file_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='file-transfer-prepare'
+                )
+            return self._file_executor.submit(create, file_size_mb)
+    
+    def _discard_local_file(self, local_file_future: Future) -> None:
+        """
+        Cancel or remove a local file prepared for a transfer that failed.
+        
+        Waits for a file that is already being written, so it is deleted
+        rather than left behind for a cleanup() that may already have run.
+        
+        Args:
+            local_file_future: Future returned by _prepare_local_file
+        """
+        if local_file_future.cancel():
+            return
+        
+        try:
+            file_path = local_file_future.result()
+        except Exception as e:
+            logger.debug(f"Preparing local file for failed transfer also failed: {e}")
+            return
+        
+        try:
+            os.unlink(file_path)
+        except OSError as e:
+            logger.debug(f"Failed to delete unused local file {file_path}: {e}")
+            return
+        
+        try:
+            self._created_files.remove(file_path)
+        except ValueError:
+            pass
+    
+    def _verify_download(self, local_file: str, actual_size: int, file_size_mb: float,
+                         protocol: str) -> None:
+        """
+        Check a downloaded file against the test data this class uploads.
+        
+        The remote file is expected to be a test file of the requested size,
+        e.g. one written by an earlier upload.
+        
+        Args:
+            local_file: Path of the downloaded file
+            actual_size: Number of bytes received
+            file_size_mb: Requested file size in megabytes
+            protocol: Protocol name used in the error message
+            
+        Raises:
+            FileTransferProtocolError: If the size or checksum does not match
+        """
+        expected_size = _mb_to_bytes(file_size_mb)
+        if actual_size != expected_size:
+            raise FileTransferProtocolError(
+                f"{protocol} download integrity check failed: "
+                f"received {actual_size} of {expected_size} bytes"
+            )
+        if _file_crc32(local_file) != _pattern_crc32(expected_size):
+            raise FileTransferProtocolError(
+                f"{protocol} download integrity check failed: CRC-32 mismatch"
+            )
+    
     def test_smb_transfer(
         self,
         server_address: str,
@@ -124,7 +360,8 @@ class FileTransferTester:
         password: str = "",
         domain: str = "",
         port: int = 445,
-        remote_file_path: str = "test_file.dat"
+        remote_file_path: str = "test_file.dat",
+        verify: bool = False
     ) -> FileTransferResult:
         """
         Test SMB file transfer performance.
@@ -139,6 +376,7 @@ class FileTransferTester:
             domain: SMB domain
             port: SMB port (default 445)
             remote_file_path: Path within share for test file
+            verify: Check downloaded data against the test file contents
             
         Returns:
             FileTransferResult: Transfer performance results
@@ -147,21 +385,15 @@ class FileTransferTester:
             raise FileTransferError("SMB support not available. Install pysmb: pip install pysmb")
         
         local_file = None
+        local_file_future = None
         conn = None
         
         try:
-            # Create test file for upload or prepare for download
-            if direction.lower() == "upload":
-                local_file = self.create_test_file(file_size_mb)
-            elif direction.lower() == "download":
-                local_file = tempfile.mktemp(
-                    suffix='.dat',
-                    prefix=f'download_{file_size_mb}MB_',
-                    dir=self.temp_dir
-                )
-                self._created_files.append(local_file)
-            else:
-                raise ValueError(f"Invalid direction: {direction}. Must be 'upload' or 'download'")
+            direction = direction.lower()
+            is_upload = direction == "upload"
+            
+            # Create test file for upload or prepare for download while connecting
+            local_file_future = self._prepare_local_file(direction, file_size_mb)
             
             # Establish SMB connection
             conn = SMBConnection(
@@ -170,27 +402,35 @@ class FileTransferTester:
                 my_name="client",
                 remote_name="server",
                 domain=domain,
-                use_ntlm_v2=True
+                use_ntlm_v2=True,
+                # Port 445 is SMB over plain TCP; 139 needs a NetBIOS session
+                is_direct_tcp=(port == 445)
             )
             
             if not conn.connect(server_address, port, timeout=self.timeout):
                 raise FileTransferConnectionError(f"Failed to connect to SMB server {server_address}:{port}")
             
+            local_file = local_file_future.result()
+            
             # Perform transfer and measure time
             start_time = time.perf_counter()
             
-            if direction.lower() == "upload":
-                with open(local_file, 'rb') as f:
+            if is_upload:
+                with open(local_file, 'rb', buffering=_COPY_BUFFER_SIZE) as f:
                     conn.storeFile(share_name, remote_file_path, f)
-                actual_size = os.path.getsize(local_file)
+                actual_size = _mb_to_bytes(file_size_mb)
             else:  # download
-                with open(local_file, 'wb') as f:
+                with open(local_file, 'r+b', buffering=_COPY_BUFFER_SIZE) as f:
                     conn.retrieveFile(share_name, remote_file_path, f)
-                actual_size = os.path.getsize(local_file)
+                    # Drop the preallocated tail; the new size is what arrived
+                    actual_size = f.truncate()
             
             end_time = time.perf_counter()
             transfer_time = end_time - start_time
-            transfer_speed = (actual_size / (1024 * 1024)) / transfer_time  # MB/s
+            transfer_speed = actual_size / _MB / transfer_time  # MB/s
+            
+            if verify and not is_upload:
+                self._verify_download(local_file, actual_size, file_size_mb, "SMB")
             
             return FileTransferResult(
                 server_address=server_address,
@@ -198,7 +438,7 @@ class FileTransferTester:
                 transfer_time=transfer_time,
                 transfer_speed=transfer_speed,
                 protocol="SMB",
-                direction=direction.lower()
+                direction=direction
             )
             
         except Exception as e:
@@ -207,6 +447,8 @@ class FileTransferTester:
             raise FileTransferProtocolError(f"SMB transfer failed: {e}")
             
         finally:
+            if local_file is None and local_file_future is not None:
+                self._discard_local_file(local_file_future)
             if conn:
                 try:
                     conn.close()
@@ -222,7 +464,8 @@ class FileTransferTester:
         password: str = "anonymous@example.com",
         port: int = 21,
         remote_file_path: str = "test_file.dat",
-        passive: bool = True
+        passive: bool = True,
+        verify: bool = False
     ) -> FileTransferResult:
         """
         Test FTP file transfer performance.
@@ -236,26 +479,21 @@ class FileTransferTester:
             port: FTP port (default 21)
             remote_file_path: Remote file path
             passive: Use passive mode
+            verify: Check downloaded data against the test file contents
             
         Returns:
             FileTransferResult: Transfer performance results
         """
         local_file = None
+        local_file_future = None
         ftp = None
         
         try:
-            # Create test file for upload or prepare for download
-            if direction.lower() == "upload":
-                local_file = self.create_test_file(file_size_mb)
-            elif direction.lower() == "download":
-                local_file = tempfile.mktemp(
-                    suffix='.dat',
-                    prefix=f'download_{file_size_mb}MB_',
-                    dir=self.temp_dir
-                )
-                self._created_files.append(local_file)
-            else:
-                raise ValueError(f"Invalid direction: {direction}. Must be 'upload' or 'download'")
+            direction = direction.lower()
+            is_upload = direction == "upload"
+            
+            # Create test file for upload or prepare for download while connecting
+            local_file_future = self._prepare_local_file(direction, file_size_mb)
             
             # Establish FTP connection
             ftp = ftplib.FTP()
@@ -265,21 +503,40 @@ class FileTransferTester:
             if passive:
                 ftp.set_pasv(True)
             
+            local_file = local_file_future.result()
+            
             # Perform transfer and measure time
             start_time = time.perf_counter()
             
-            if direction.lower() == "upload":
+            if is_upload:
                 with open(local_file, 'rb') as f:
-                    ftp.storbinary(f'STOR {remote_file_path}', f)
-                actual_size = os.path.getsize(local_file)
+                    if _HAS_SENDFILE:
+                        # Equivalent to storbinary, but socket.sendfile lets
+                        # the kernel copy the file straight to the data
+                        # connection
+                        ftp.voidcmd('TYPE I')
+                        with ftp.transfercmd(f'STOR {remote_file_path}') as data_conn:
+                            # Send the final partial segment without waiting on
+                            # Nagle coalescing (http.client already does this)
+                            data_conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                            data_conn.sendfile(f)
+                        ftp.voidresp()
+                    else:
+                        ftp.storbinary(f'STOR {remote_file_path}', f,
+                                       blocksize=_COPY_BUFFER_SIZE)
+                actual_size = _mb_to_bytes(file_size_mb)
             else:  # download
-                with open(local_file, 'wb') as f:
-                    ftp.retrbinary(f'RETR {remote_file_path}', f.write)
-                actual_size = os.path.getsize(local_file)
+                with open(local_file, 'r+b', buffering=_COPY_BUFFER_SIZE) as f:
+                    ftp.retrbinary(f'RETR {remote_file_path}', f.write, blocksize=_COPY_BUFFER_SIZE)
+                    # Drop the preallocated tail; the new size is what arrived
+                    actual_size = f.truncate()
             
             end_time = time.perf_counter()
             transfer_time = end_time - start_time
-            transfer_speed = (actual_size / (1024 * 1024)) / transfer_time  # MB/s
+            transfer_speed = actual_size / _MB / transfer_time  # MB/s
+            
+            if verify and not is_upload:
+                self._verify_download(local_file, actual_size, file_size_mb, "FTP")
             
             return FileTransferResult(
                 server_address=server_address,
@@ -287,7 +544,7 @@ class FileTransferTester:
                 transfer_time=transfer_time,
                 transfer_speed=transfer_speed,
                 protocol="FTP",
-                direction=direction.lower()
+                direction=direction
             )
             
         except Exception as e:
@@ -296,6 +553,8 @@ class FileTransferTester:
             raise FileTransferProtocolError(f"FTP transfer failed: {e}")
             
         finally:
+            if local_file is None and local_file_future is not None:
+                self._discard_local_file(local_file_future)
             if ftp:
                 try:
                     ftp.quit()
@@ -314,7 +573,8 @@ class FileTransferTester:
         remote_file_path: str = "/test_file.dat",
         upload_endpoint: str = "/upload",
         use_https: bool = False,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        verify: bool = False
     ) -> FileTransferResult:
         """
         Test HTTP/HTTPS file transfer performance.
@@ -328,6 +588,7 @@ class FileTransferTester:
             upload_endpoint: Endpoint for upload
             use_https: Use HTTPS instead of HTTP
             headers: Additional HTTP headers
+            verify: Check downloaded data against the test file contents
             
         Returns:
             FileTransferResult: Transfer performance results
@@ -342,67 +603,91 @@ class FileTransferTester:
             if use_https and port == 80:
                 port = 443
             
+            direction = direction.lower()
+            is_upload = direction == "upload"
+            
             # Create test file for upload or prepare for download
-            if direction.lower() == "upload":
+            if is_upload:
                 local_file = self.create_test_file(file_size_mb)
-            elif direction.lower() == "download":
-                local_file = tempfile.mktemp(
-                    suffix='.dat',
-                    prefix=f'download_{file_size_mb}MB_',
-                    dir=self.temp_dir
-                )
-                self._created_files.append(local_file)
+            elif direction == "download":
+                local_file = self._create_download_file(file_size_mb)
             else:
                 raise ValueError(f"Invalid direction: {direction}. Must be 'upload' or 'download'")
             
             # Perform transfer and measure time
             start_time = time.perf_counter()
             
-            if direction.lower() == "upload":
-                # HTTP upload using POST with file data
-                with open(local_file, 'rb') as f:
-                    file_data = f.read()
-                
-                if use_https:
-                    conn = http.client.HTTPSConnection(server_address, port, timeout=self.timeout)
-                else:
-                    conn = http.client.HTTPConnection(server_address, port, timeout=self.timeout)
+            if is_upload:
+                # HTTP upload using POST, streaming the file as the body
+                file_size = _mb_to_bytes(file_size_mb)
                 
                 headers['Content-Type'] = 'application/octet-stream'
-                headers['Content-Length'] = str(len(file_data))
+                headers['Content-Length'] = str(file_size)
                 
-                conn.request('POST', upload_endpoint, body=file_data, headers=headers)
-                response = conn.getresponse()
+                pool_key = (server_address, port, use_https)
+                conn, reused = self._get_http_connection(pool_key)
+                try:
+                    with open(local_file, 'rb') as f:
+                        try:
+                            conn.request('POST', upload_endpoint, body=f, headers=headers)
+                            response = conn.getresponse()
+                        except ConnectionError:
+                            # The server may have closed an idle keep-alive
+                            # connection; retry once on a fresh one
+                            if not reused:
+                                raise
+                            conn.close()
+                            conn = self._new_http_connection(pool_key)
+                            f.seek(0)
+                            # Time only the successful attempt, as file_size
+                            # counts a single copy of the body
+                            start_time = time.perf_counter()
+                            conn.request('POST', upload_endpoint, body=f, headers=headers)
+                            response = conn.getresponse()
+                    
+                    # Drain the body so the connection can carry the next request
+                    response.read()
+                except Exception:
+                    conn.close()
+                    raise
                 
                 if response.status not in (200, 201, 202):
+                    conn.close()
                     raise FileTransferProtocolError(f"HTTP upload failed with status {response.status}")
                 
-                actual_size = len(file_data)
-                conn.close()
+                actual_size = file_size
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._http_pool.setdefault(pool_key, []).append(conn)
                 
             else:  # download
                 url = f"{'https' if use_https else 'http'}://{server_address}:{port}{remote_file_path}"
                 
                 request = urllib.request.Request(url, headers=headers)
                 with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                    with open(local_file, 'wb') as f:
-                        f.write(response.read())
-                
-                actual_size = os.path.getsize(local_file)
+                    with open(local_file, 'r+b') as f:
+                        # Stream to disk instead of buffering the whole body
+                        shutil.copyfileobj(response, f, _COPY_BUFFER_SIZE)
+                        # Drop the preallocated tail; the new size is what arrived
+                        actual_size = f.truncate()
             
             end_time = time.perf_counter()
             transfer_time = end_time - start_time
-            transfer_speed = (actual_size / (1024 * 1024)) / transfer_time  # MB/s
+            transfer_speed = actual_size / _MB / transfer_time  # MB/s
             
             protocol = "HTTPS" if use_https else "HTTP"
             
+            if verify and not is_upload:
+                self._verify_download(local_file, actual_size, file_size_mb, protocol)
+            
             return FileTransferResult(
                 server_address=server_address,
                 file_size=actual_size,
                 transfer_time=transfer_time,
                 transfer_speed=transfer_speed,
                 protocol=protocol,
-                direction=direction.lower()
+                direction=direction
             )
             
         except Exception as e:
@@ -410,18 +695,62 @@ class FileTransferTester:
                 raise
             raise FileTransferProtocolError(f"HTTP transfer failed: {e}")
     
+    def _new_http_connection(self, pool_key: Tuple[str, int, bool]) -> http.client.HTTPConnection:
+        """
+        Open a new HTTP or HTTPS connection.
+        
+        Args:
+            pool_key: Tuple of (server_address, port, use_https)
+            
+        Returns:
+            HTTPConnection or HTTPSConnection (not yet connected)
+        """
+        server_address, port, use_https = pool_key
+        if use_https:
+            return http.client.HTTPSConnection(server_address, port, timeout=self.timeout,
+                                               blocksize=_COPY_BUFFER_SIZE)
+        return http.client.HTTPConnection(server_address, port, timeout=self.timeout,
+                                          blocksize=_COPY_BUFFER_SIZE)
+    
+    def _get_http_connection(
+        self,
+        pool_key: Tuple[str, int, bool]
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take an idle keep-alive connection from the pool or open a new one.
+        
+        Reusing a connection saves the TCP (and TLS) handshake on every
+        iteration after the first.
+        
+        Args:
+            pool_key: Tuple of (server_address, port, use_https)
+            
+        Returns:
+            Tuple of (connection, whether it was reused)
+        """
+        try:
+            return self._http_pool[pool_key].pop(), True
+        except (KeyError, IndexError):
+            return self._new_http_connection(pool_key), False
+    
     def run_multiple_transfers(
         self,
         transfer_func: callable,
         iterations: int = 3,
+        parallel: int = 1,
         **kwargs
     ) -> Tuple[List[FileTransferResult], Dict[str, float]]:
         """
         Run multiple transfer tests and calculate statistics.
         
+        With parallel > 1 the iterations run concurrently on a thread pool,
+        which uses several TCP streams when a single one cannot saturate the
+        link. Each result then reflects its own stream's share of the link.
+        
         Args:
             transfer_func: Transfer function to call (test_smb_transfer, etc.)
             iterations: Number of iterations to run
+            parallel: Maximum number of iterations to run at the same time
             **kwargs: Arguments to pass to transfer function
             
         Returns:
@@ -429,18 +758,30 @@ class FileTransferTester:
         """
         if iterations < 1:
             raise ValueError("Iterations must be at least 1")
+        if parallel < 1:
+            raise ValueError("Parallel must be at least 1")
         
         results = []
         errors = []
         
-        for i in range(iterations):
+        def record(iteration: int, run: callable) -> None:
             try:
-                logger.debug(f"Running transfer iteration {i + 1}/{iterations}")
-                result = transfer_func(**kwargs)
-                results.append(result)
+                results.append(run())
             except Exception as e:
                 errors.append(str(e))
-                logger.warning(f"Transfer iteration {i + 1} failed: {e}")
+                logger.warning(f"Transfer iteration {iteration + 1} failed: {e}")
+        
+        if parallel == 1:
+            for i in range(iterations):
+                logger.debug(f"Running transfer iteration {i + 1}/{iterations}")
+                record(i, lambda: transfer_func(**kwargs))
+        else:
+            logger.debug(f"Running {iterations} transfer iterations, {parallel} at a time")
+            with ThreadPoolExecutor(max_workers=min(parallel, iterations)) as executor:
+                futures = [executor.submit(transfer_func, **kwargs) for _ in range(iterations)]
+                # Collect in submission order so results keep iteration order
+                for i, future in enumerate(futures):
+                    record(i, future.result)
         
         if not results:
             raise FileTransferError(f"All {iterations} transfer attempts failed. Errors: {errors}")
@@ -449,37 +790,62 @@ class FileTransferTester:
         speeds = [r.transfer_speed for r in results]
         times = [r.transfer_time for r in results]
         
+        # Each aggregate is computed once; statistics.mean is exact (and slow)
+        # for long sweeps, so the mean is also passed to stdev
+        avg_speed = statistics.mean(speeds)
+        min_speed = min(speeds)
+        max_speed = max(speeds)
+        
         stats = {
             'iterations_completed': len(results),
             'iterations_failed': len(errors),
-            'avg_speed_mb_s': statistics.mean(speeds),
-            'min_speed_mb_s': min(speeds),
-            'max_speed_mb_s': max(speeds),
-            'std_dev_speed_mb_s': statistics.stdev(speeds) if len(speeds) > 1 else 0.0,
+            'avg_speed_mb_s': avg_speed,
+            'min_speed_mb_s': min_speed,
+            'max_speed_mb_s': max_speed,
+            'std_dev_speed_mb_s': statistics.stdev(speeds, avg_speed) if len(speeds) > 1 else 0.0,
             'avg_time_s': statistics.mean(times),
             'min_time_s': min(times),
             'max_time_s': max(times),
-            'speed_variation_percent': ((max(speeds) - min(speeds)) / statistics.mean(speeds) * 100) if speeds else 0.0
+            'speed_variation_percent': ((max_speed - min_speed) / avg_speed * 100) if speeds else 0.0
         }
         
         return results, stats
     
     def cleanup(self) -> None:
         """Clean up all created test files."""
+        # Let in-progress file preparation finish so its file is removed too
+        with self._file_executor_lock:
+            if self._file_executor is not None:
+                self._file_executor.shutdown(wait=True)
+                self._file_executor = None
+        
         cleaned_count = 0
         errors = []
+        remaining = []
         
-        for file_path in self._created_files[:]:  # Create a copy to iterate
+        for file_path in self._created_files:
             try:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                    cleaned_count += 1
-                self._created_files.remove(file_path)
-            except Exception as e:
+                os.unlink(file_path)
+                cleaned_count += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 errors.append(f"Failed to delete {file_path}: {e}")
+                remaining.append(file_path)
+        
+        # Keep only the files that could not be removed so a later call can retry
+        self._created_files[:] = remaining
+        
+        # Cached paths were among the created files
+        self._file_cache.clear()
         
-        # Clear cache
-        self._test_data_cache.clear()
+        for connections in self._http_pool.values():
+            for conn in connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        self._http_pool.clear()
         
         if errors:
             logger.warning(f"Cleanup completed with errors: {errors}")
@@ -46,6 +46,8 @@ class MeasurementSequence:
     continue_on_failure: bool = False
     export_results: bool = True
     cleanup_on_exit: bool = True
+    # Re-validate prerequisites only every N cycles once they have passed
+    prerequisite_check_interval: int = 1
 
 
 @dataclass
@@ -99,6 +101,8 @@ class MeasurementOrchestrator:
         # State tracking
         self._current_measurement_id: Optional[str] = None
         self._step_results: Dict[MeasurementType, MeasurementStatus] = {}
+        # Cycles run since prerequisites last passed (None: not passed yet)
+        self._cycles_since_validation: Optional[int] = None
         self._callbacks: Dict[str, List[Callable]] = {
             'before_measurement': [],
             'after_measurement': [],
@@ -229,6 +233,28 @@ class MeasurementOrchestrator:
         
         return len(issues) == 0, issues
     
+    def _prerequisites_due(self, sequence: MeasurementSequence) -> bool:
+        """
+        Check whether this cycle should re-validate prerequisites.
+        
+        Until a check passes every cycle validates; after that, only every
+        prerequisite_check_interval-th cycle does.
+        
+        Args:
+            sequence: Measurement sequence being executed
+            
+        Returns:
+            True if prerequisites should be validated
+        """
+        if self._cycles_since_validation is None:
+            return True
+        
+        if self._cycles_since_validation + 1 >= sequence.prerequisite_check_interval:
+            return True
+        
+        self._cycles_since_validation += 1
+        return False
+    
     def execute_measurement_cycle(self, 
                                   sequence: Optional[MeasurementSequence] = None,
                                   measurement_id: Optional[str] = None) -> OrchestrationResult:
@@ -268,8 +294,9 @@ class MeasurementOrchestrator:
         
         try:
             # Validate prerequisites if required
-            if sequence.validate_prerequisites:
+            if sequence.validate_prerequisites and self._prerequisites_due(sequence):
                 is_valid, issues = self.validate_prerequisites()
+                self._cycles_since_validation = 0 if is_valid else None
                 if not is_valid:
                     error_msg = f"Prerequisites validation failed: {issues}"
                     self.logger.error(error_msg)
@@ -394,7 +421,7 @@ class MeasurementOrchestrator:
             Measurement result object
         """
         measurement_type = step.measurement_type
-        params = step.parameters.copy()
+        params = step.parameters  # read-only here; no per-cycle copy needed
         timeout = step.timeout
         
         if measurement_type == MeasurementType.WIFI_INFO:
@@ -628,4 +655,6 @@ class MeasurementOrchestrator:
         except Exception as e:
             self.logger.warning(f"Cleanup failed: {e}")
         
+        self.data_export_manager.close()
+        
         self.logger.info("MeasurementOrchestrator cleanup completed")
\ No newline at end of file
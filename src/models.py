@@ -1,11 +1,17 @@
 """Data models for wireless LAN analyzer."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
 
+# Keyword arguments for @dataclass on classes that should use __slots__;
+# dataclass(slots=True) needs Python 3.10+, older versions keep a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class MeasurementType(Enum):
     """Types of network measurements."""
     WIFI_INFO = "wifi_info"
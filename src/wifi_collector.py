@@ -1,40 +1,112 @@
 """WiFi information collector using Win32 API."""
 
+import ctypes
+import functools
+import locale
 import logging
+import re
 import subprocess
 import json
 import platform
-from typing import Optional, Dict, Any, List
+import sys
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from src.models import WiFiInfo
+from src import wlanapi
+
+# One "Key : Value" line of netsh output; the key stops at the first colon
+# so values such as BSSIDs keep their own colons.
+_NETSH_FIELD_RE = re.compile(r'^[ \t]*([^:\r\n]+?)[ \t]*:[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# netsh field labels (English and Japanese Windows), matched exactly
+_NETSH_NAME_LABELS = frozenset({'Name', '名前'})
+_NETSH_FIELDS = {
+    'SSID': 'ssid',
+    'BSSID': 'mac_address',
+    'AP BSSID': 'mac_address',
+    'Channel': 'channel',
+    'チャネル': 'channel',
+    'Receive rate (Mbps)': 'rx_rate',
+    '受信速度 (Mbps)': 'rx_rate',
+    'Transmit rate (Mbps)': 'tx_rate',
+    '送信速度 (Mbps)': 'tx_rate',
+    'Signal': 'quality',
+    'シグナル': 'quality',
+}
+
+# Parsing stops once info holds this many keys (every field plus the
+# rssi derived from the signal quality).
+_NETSH_INFO_SIZE = len(set(_NETSH_FIELDS.values())) + 1
+
+
+@functools.lru_cache(maxsize=None)
+def _console_encoding() -> str:
+    """Return the encoding console tools such as netsh write to a pipe.
+
+    On Windows this is the OEM code page (e.g. cp932 on Japanese systems),
+    not UTF-8 and not the ANSI code page Python picks for text=True.
+    """
+    if sys.platform == "win32":
+        return f"cp{ctypes.windll.kernel32.GetOEMCP()}"
+    return locale.getpreferredencoding(False)
+
+
+def _decode_console_output(data: bytes) -> str:
+    """Decode raw console tool output without silently mangling it.
+
+    Args:
+        data: Bytes captured from the tool's stdout or stderr.
+
+    Returns:
+        Decoded text; undecodable bytes are only replaced if the console
+        encoding does not match the data at all.
+    """
+    try:
+        return data.decode(_console_encoding())
+    except (UnicodeDecodeError, LookupError):
+        return data.decode('utf-8', errors='replace')
 
 
 class WiFiInfoCollector:
     """Collects wireless LAN information using platform-specific APIs."""
 
-    def __init__(self, interface_name: str = "Wi-Fi"):
+    def __init__(self, interface_name: str = "Wi-Fi", cache_ttl: float = 2.0):
         """Initialize WiFi info collector.
         
         Args:
             interface_name: Name of the wireless interface.
+            cache_ttl: Seconds a successful reading is reused before the
+                platform tools are queried again (0 disables caching).
         """
         self.interface_name = interface_name
+        self.cache_ttl = cache_ttl
         self.logger = logging.getLogger(__name__)
         self.platform = platform.system()
+        self._cache: Dict[str, Tuple[float, WiFiInfo]] = {}
         
     def collect_wifi_info(self) -> Optional[WiFiInfo]:
         """Collect current WiFi information.
         
+        Successful readings are cached per interface for ``cache_ttl``
+        seconds, so back-to-back callers (e.g. is_connected() followed by
+        a measurement) do not re-run the platform tools.
+        
         Returns:
             WiFiInfo object with current wireless information, or None if failed.
         """
+        now = time.monotonic()
+        cached = self._cache.get(self.interface_name)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
+        
         try:
             if self.platform == "Windows":
-                return self._collect_windows_wifi_info()
+                wifi_info = self._collect_windows_wifi_info()
             elif self.platform == "Linux":
-                return self._collect_linux_wifi_info()
+                wifi_info = self._collect_linux_wifi_info()
             elif self.platform == "Darwin":  # macOS
-                return self._collect_macos_wifi_info()
+                wifi_info = self._collect_macos_wifi_info()
             else:
                 self.logger.error(f"Unsupported platform: {self.platform}")
                 return None
@@ -42,35 +114,40 @@ class WiFiInfoCollector:
         except Exception as e:
             self.logger.error(f"Failed to collect WiFi info: {e}")
             return None
+        
+        if wifi_info is not None:
+            self._cache[self.interface_name] = (now, wifi_info)
+        return wifi_info
 
     def _collect_windows_wifi_info(self) -> Optional[WiFiInfo]:
-        """Collect WiFi info on Windows using netsh command.
+        """Collect WiFi info on Windows using the Native Wifi API.
+        
+        Falls back to the netsh command if wlanapi.dll is not usable.
         
         Returns:
             WiFiInfo object or None if failed.
         """
         try:
-            # Get interface details
-            interface_info = self._get_windows_interface_info()
-            if not interface_info:
-                return None
-                
-            # Get signal strength and quality
-            signal_info = self._get_windows_signal_info()
-            if not signal_info:
+            # Prefer the Native Wifi API; otherwise a single netsh call
+            # provides both interface details and signal strength
+            info = self._get_windows_native_info()
+            if info is None:
+                info = self._get_windows_interface_info()
+            
+            if not info or 'quality' not in info:
                 return None
             
             # Combine information
             wifi_info = WiFiInfo(
-                ssid=interface_info.get('ssid', 'Unknown'),
-                rssi=signal_info.get('rssi', -100),
-                link_quality=signal_info.get('quality', 0),
-                tx_rate=interface_info.get('tx_rate', 0.0),
-                rx_rate=interface_info.get('rx_rate', 0.0),
-                channel=interface_info.get('channel', 0),
-                frequency=self._channel_to_frequency(interface_info.get('channel', 0)),
+                ssid=info.get('ssid', 'Unknown'),
+                rssi=info.get('rssi', -100),
+                link_quality=info.get('quality', 0),
+                tx_rate=info.get('tx_rate', 0.0),
+                rx_rate=info.get('rx_rate', 0.0),
+                channel=info.get('channel', 0),
+                frequency=self._channel_to_frequency(info.get('channel', 0)),
                 interface_name=self.interface_name,
-                mac_address=interface_info.get('mac_address', '00:00:00:00:00:00')
+                mac_address=info.get('mac_address', '00:00:00:00:00:00')
             )
             
             wifi_info.validate()
@@ -80,83 +157,67 @@ class WiFiInfoCollector:
             self.logger.error(f"Windows WiFi collection failed: {e}")
             return None
 
+    def _get_windows_native_info(self) -> Optional[Dict[str, Any]]:
+        """Get Windows interface information from wlanapi.dll via ctypes.
+        
+        Returns:
+            Dictionary with interface and signal information (empty if the
+            interface is not connected), or None if the API is unavailable.
+        """
+        if not wlanapi.AVAILABLE:
+            return None
+        
+        try:
+            info = wlanapi.query_interface(self.interface_name)
+        except (OSError, AttributeError) as e:
+            self.logger.debug("Native Wifi API unavailable, falling back to netsh: %s", e)
+            return None
+        
+        if 'quality' in info:
+            info['rssi'] = self._quality_to_rssi(info['quality'])
+        return info
+
     def _get_windows_interface_info(self) -> Dict[str, Any]:
-        """Get Windows interface information using netsh.
+        """Get Windows interface and signal information using netsh.
+        
+        Output is parsed line by line as netsh writes it, and netsh is
+        stopped as soon as every field has been read.
         
         Returns:
-            Dictionary with interface information.
+            Dictionary with interface and signal information.
         """
         try:
-            # Get interface status
-            cmd = f'netsh wlan show interfaces name="{self.interface_name}"'
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-            
-            if result.returncode != 0:
-                self.logger.error(f"netsh command failed: {result.stderr}")
-                return {}
-            
-            output = result.stdout
+            # Get interface status (argv list: no cmd.exe in between)
+            cmd = ["netsh", "wlan", "show", "interfaces", f"name={self.interface_name}"]
             info = {}
-            
-            # Parse output
-            for line in output.split('\n'):
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
+            message = ''
+            
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT) as proc:
+                for raw_line in proc.stdout:
+                    line = _decode_console_output(raw_line)
+                    match = _NETSH_FIELD_RE.match(line)
+                    if not match:
+                        # netsh reports errors as plain sentences
+                        message = line.strip() or message
+                        continue
+                    key, value = match.groups()
+                    
+                    field = _NETSH_FIELDS.get(key)
                     
-                    if 'SSID' in key and 'BSSID' not in key:
-                        info['ssid'] = value
-                    elif 'BSSID' in key:
-                        info['mac_address'] = value
-                    elif 'Channel' in key:
+                    if field == 'ssid' or field == 'mac_address':
+                        info[field] = value
+                    elif field == 'channel':
                         try:
                             info['channel'] = int(value)
                         except ValueError:
                             pass
-                    elif 'Receive rate' in key:
+                    elif field == 'rx_rate' or field == 'tx_rate':
                         try:
-                            info['rx_rate'] = float(value.split()[0])
+                            info[field] = float(value.split()[0])
                         except (ValueError, IndexError):
                             pass
-                    elif 'Transmit rate' in key:
-                        try:
-                            info['tx_rate'] = float(value.split()[0])
-                        except (ValueError, IndexError):
-                            pass
-            
-            return info
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get Windows interface info: {e}")
-            return {}
-
-    def _get_windows_signal_info(self) -> Dict[str, Any]:
-        """Get Windows signal strength information.
-        
-        Returns:
-            Dictionary with signal information.
-        """
-        try:
-            # Get signal strength
-            cmd = f'netsh wlan show interfaces name="{self.interface_name}"'
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-            
-            if result.returncode != 0:
-                return {}
-            
-            output = result.stdout
-            info = {}
-            
-            for line in output.split('\n'):
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if 'Signal' in key:
+                    elif field == 'quality':
                         try:
                             # Parse percentage (e.g., "80%")
                             quality = int(value.replace('%', ''))
@@ -165,11 +226,20 @@ class WiFiInfoCollector:
                             info['rssi'] = self._quality_to_rssi(quality)
                         except ValueError:
                             pass
+                    
+                    # Trailing lines (profile, hosted network) are not needed
+                    if len(info) == _NETSH_INFO_SIZE:
+                        proc.kill()
+                        return info
+            
+            if proc.returncode != 0:
+                self.logger.error(f"netsh command failed: {message}")
+                return {}
             
             return info
             
         except Exception as e:
-            self.logger.error(f"Failed to get Windows signal info: {e}")
+            self.logger.error(f"Failed to get Windows interface info: {e}")
             return {}
 
     def _collect_linux_wifi_info(self) -> Optional[WiFiInfo]:
@@ -223,7 +293,7 @@ class WiFiInfoCollector:
             
             if result.returncode == 0:
                 output = result.stdout
-                for line in output.split('\n'):
+                for line in output.splitlines():
                     if 'SSID:' in line:
                         info['ssid'] = line.split('SSID:')[1].strip()
                     elif 'freq:' in line:
@@ -253,7 +323,7 @@ class WiFiInfoCollector:
             
             if result.returncode == 0:
                 output = result.stdout
-                for line in output.split('\n'):
+                for line in output.splitlines():
                     if 'link/ether' in line:
                         parts = line.split()
                         idx = parts.index('link/ether')
@@ -267,7 +337,7 @@ class WiFiInfoCollector:
             return info
             
         except Exception as e:
-            self.logger.debug(f"iw command failed: {e}")
+            self.logger.debug("iw command failed: %s", e)
             return {}
 
     def _get_linux_iwconfig_info(self) -> Dict[str, Any]:
@@ -287,7 +357,7 @@ class WiFiInfoCollector:
             info = {}
             
             # Parse iwconfig output
-            for line in output.split('\n'):
+            for line in output.splitlines():
                 if 'ESSID:' in line:
                     essid = line.split('ESSID:')[1].strip().strip('"')
                     info['ssid'] = essid
@@ -321,7 +391,7 @@ class WiFiInfoCollector:
             result = subprocess.run(cmd.split(), capture_output=True, text=True)
             
             if result.returncode == 0:
-                for line in result.stdout.split('\n'):
+                for line in result.stdout.splitlines():
                     if 'link/ether' in line:
                         parts = line.split()
                         idx = parts.index('link/ether')
@@ -331,7 +401,7 @@ class WiFiInfoCollector:
             return info
             
         except Exception as e:
-            self.logger.debug(f"iwconfig command failed: {e}")
+            self.logger.debug("iwconfig command failed: %s", e)
             return {}
 
     def _collect_macos_wifi_info(self) -> Optional[WiFiInfo]:
@@ -351,34 +421,34 @@ class WiFiInfoCollector:
             output = result.stdout
             info = {}
             
-            for line in output.split('\n'):
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key == 'SSID':
-                        info['ssid'] = value
-                    elif key == 'BSSID':
-                        info['mac_address'] = value
-                    elif key == 'channel':
-                        try:
-                            info['channel'] = int(value.split(',')[0])
-                        except (ValueError, IndexError):
-                            pass
-                    elif key == 'agrCtlRSSI':
-                        try:
-                            info['rssi'] = int(value)
-                            info['quality'] = self._rssi_to_quality(int(value))
-                        except ValueError:
-                            pass
-                    elif key == 'lastTxRate':
-                        try:
-                            info['tx_rate'] = float(value)
-                            info['rx_rate'] = float(value)  # Approximation
-                        except ValueError:
-                            pass
+            for line in output.splitlines():
+                key, sep, value = line.partition(':')
+                if not sep:
+                    continue
+                key = key.strip()
+                value = value.strip()
+                
+                if key == 'SSID':
+                    info['ssid'] = value
+                elif key == 'BSSID':
+                    info['mac_address'] = value
+                elif key == 'channel':
+                    try:
+                        info['channel'] = int(value.split(',')[0])
+                    except (ValueError, IndexError):
+                        pass
+                elif key == 'agrCtlRSSI':
+                    try:
+                        info['rssi'] = int(value)
+                        info['quality'] = self._rssi_to_quality(int(value))
+                    except ValueError:
+                        pass
+                elif key == 'lastTxRate':
+                    try:
+                        info['tx_rate'] = float(value)
+                        info['rx_rate'] = float(value)  # Approximation
+                    except ValueError:
+                        pass
             
             if 'channel' in info:
                 info['frequency'] = self._channel_to_frequency(info['channel'])
@@ -489,21 +559,21 @@ class WiFiInfoCollector:
         
         try:
             if self.platform == "Windows":
-                cmd = "netsh wlan show interfaces"
-                result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
+                cmd = ["netsh", "wlan", "show", "interfaces"]
+                result = subprocess.run(cmd, capture_output=True)
                 
                 if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'Name' in line and ':' in line:
-                            name = line.split(':')[1].strip()
-                            interfaces.append(name)
+                    for line in _decode_console_output(result.stdout).splitlines():
+                        key, sep, value = line.partition(':')
+                        if sep and key.strip() in _NETSH_NAME_LABELS:
+                            interfaces.append(value.strip())
                             
             elif self.platform == "Linux":
                 cmd = "ip link show"
                 result = subprocess.run(cmd.split(), capture_output=True, text=True)
                 
                 if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
+                    for line in result.stdout.splitlines():
                         if ':' in line and 'mtu' in line:
                             parts = line.split(':')
                             if len(parts) >= 2:
@@ -0,0 +1,281 @@
+"""Native Wifi API (wlanapi.dll) access via ctypes for Windows."""
+
+import atexit
+import ctypes
+import sys
+import threading
+from typing import Optional, Dict, Any, List, Tuple
+
+# Native Wifi is only present on Windows; callers should check this flag
+# before using the query functions and fall back to netsh otherwise.
+AVAILABLE = sys.platform == "win32"
+
+WLAN_CLIENT_VERSION = 2
+ERROR_SUCCESS = 0
+
+# WLAN_INTF_OPCODE values
+WLAN_INTF_OPCODE_CURRENT_CONNECTION = 7
+WLAN_INTF_OPCODE_CHANNEL_NUMBER = 8
+
+# WLAN_INTERFACE_STATE values
+WLAN_INTERFACE_STATE_CONNECTED = 1
+
+DOT11_SSID_MAX_LENGTH = 32
+WLAN_MAX_NAME_LENGTH = 256
+
+# Persistent (wlanapi, iphlpapi, client_handle) session, opened on first use.
+_session: Optional[Tuple[Any, Any, ctypes.c_void_p]] = None
+_session_lock = threading.Lock()
+
+
+class GUID(ctypes.Structure):
+    """Windows GUID structure."""
+    _fields_ = [
+        ("Data1", ctypes.c_uint32),
+        ("Data2", ctypes.c_uint16),
+        ("Data3", ctypes.c_uint16),
+        ("Data4", ctypes.c_uint8 * 8),
+    ]
+
+
+class WLAN_INTERFACE_INFO(ctypes.Structure):
+    """Wireless interface entry returned by WlanEnumInterfaces."""
+    _fields_ = [
+        ("InterfaceGuid", GUID),
+        ("strInterfaceDescription", ctypes.c_wchar * WLAN_MAX_NAME_LENGTH),
+        ("isState", ctypes.c_uint32),
+    ]
+
+
+class WLAN_INTERFACE_INFO_LIST(ctypes.Structure):
+    """Variable-length list header returned by WlanEnumInterfaces."""
+    _fields_ = [
+        ("dwNumberOfItems", ctypes.c_uint32),
+        ("dwIndex", ctypes.c_uint32),
+        ("InterfaceInfo", WLAN_INTERFACE_INFO * 1),
+    ]
+
+
+class DOT11_SSID(ctypes.Structure):
+    """802.11 SSID."""
+    _fields_ = [
+        ("uSSIDLength", ctypes.c_uint32),
+        ("ucSSID", ctypes.c_uint8 * DOT11_SSID_MAX_LENGTH),
+    ]
+
+
+class WLAN_ASSOCIATION_ATTRIBUTES(ctypes.Structure):
+    """Association attributes of the current connection."""
+    _fields_ = [
+        ("dot11Ssid", DOT11_SSID),
+        ("dot11BssType", ctypes.c_uint32),
+        ("dot11Bssid", ctypes.c_uint8 * 6),
+        ("dot11PhyType", ctypes.c_uint32),
+        ("uDot11PhyIndex", ctypes.c_uint32),
+        ("wlanSignalQuality", ctypes.c_uint32),
+        ("ulRxRate", ctypes.c_uint32),  # kbps
+        ("ulTxRate", ctypes.c_uint32),  # kbps
+    ]
+
+
+class WLAN_SECURITY_ATTRIBUTES(ctypes.Structure):
+    """Security attributes of the current connection."""
+    _fields_ = [
+        ("bSecurityEnabled", ctypes.c_int32),
+        ("bOneXEnabled", ctypes.c_int32),
+        ("dot11AuthAlgorithm", ctypes.c_uint32),
+        ("dot11CipherAlgorithm", ctypes.c_uint32),
+    ]
+
+
+class WLAN_CONNECTION_ATTRIBUTES(ctypes.Structure):
+    """Result of the wlan_intf_opcode_current_connection query."""
+    _fields_ = [
+        ("isState", ctypes.c_uint32),
+        ("wlanConnectionMode", ctypes.c_uint32),
+        ("strProfileName", ctypes.c_wchar * WLAN_MAX_NAME_LENGTH),
+        ("wlanAssociationAttributes", WLAN_ASSOCIATION_ATTRIBUTES),
+        ("wlanSecurityAttributes", WLAN_SECURITY_ATTRIBUTES),
+    ]
+
+
+def _load_libraries() -> Tuple[Any, Any]:
+    """Load wlanapi.dll and iphlpapi.dll.
+
+    Returns:
+        Tuple of (wlanapi, iphlpapi) library handles.
+
+    Raises:
+        OSError: If the libraries cannot be loaded.
+    """
+    return ctypes.WinDLL("wlanapi"), ctypes.WinDLL("iphlpapi")
+
+
+def _check(result: int, function_name: str) -> None:
+    """Raise OSError for a failed Win32 return code."""
+    if result != ERROR_SUCCESS:
+        raise OSError(result, f"{function_name} failed with error {result}")
+
+
+def _interface_alias(iphlpapi: Any, guid: GUID) -> str:
+    """Resolve an interface GUID to its connection name (e.g. "Wi-Fi").
+
+    Args:
+        iphlpapi: Loaded iphlpapi library.
+        guid: Interface GUID.
+
+    Returns:
+        Interface alias, or empty string if it cannot be resolved.
+    """
+    luid = ctypes.c_uint64()
+    if iphlpapi.ConvertInterfaceGuidToLuid(ctypes.byref(guid), ctypes.byref(luid)) != ERROR_SUCCESS:
+        return ""
+
+    alias = ctypes.create_unicode_buffer(WLAN_MAX_NAME_LENGTH + 1)
+    if iphlpapi.ConvertInterfaceLuidToAlias(ctypes.byref(luid), alias, len(alias)) != ERROR_SUCCESS:
+        return ""
+    return alias.value
+
+
+def _select_interface(iphlpapi: Any, interfaces: List[WLAN_INTERFACE_INFO],
+                      interface_name: str) -> Optional[WLAN_INTERFACE_INFO]:
+    """Pick the interface matching a connection name or description.
+
+    Falls back to the only interface when there is exactly one adapter.
+    """
+    for interface in interfaces:
+        if interface.strInterfaceDescription == interface_name:
+            return interface
+        if _interface_alias(iphlpapi, interface.InterfaceGuid) == interface_name:
+            return interface
+
+    if len(interfaces) == 1:
+        return interfaces[0]
+    return None
+
+
+def _open_session() -> Tuple[Any, Any, ctypes.c_void_p]:
+    """Return the shared WLAN client session, opening it on first use.
+
+    Opening a client handle is the expensive part of a query, so one handle
+    is kept for the life of the process and closed at exit.
+
+    Returns:
+        Tuple of (wlanapi, iphlpapi, client_handle).
+
+    Raises:
+        OSError: If the libraries cannot be loaded or the handle cannot be opened.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            wlanapi, iphlpapi = _load_libraries()
+            negotiated_version = ctypes.c_uint32()
+            client_handle = ctypes.c_void_p()
+            _check(wlanapi.WlanOpenHandle(WLAN_CLIENT_VERSION, None,
+                                          ctypes.byref(negotiated_version),
+                                          ctypes.byref(client_handle)),
+                   "WlanOpenHandle")
+            _session = (wlanapi, iphlpapi, client_handle)
+        return _session
+
+
+def close() -> None:
+    """Close the shared WLAN client handle, if open."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            wlanapi, _, client_handle = _session
+            _session = None
+            wlanapi.WlanCloseHandle(client_handle, None)
+
+
+atexit.register(close)
+
+
+def query_interface(interface_name: str) -> Dict[str, Any]:
+    """Query the current connection of a wireless interface.
+
+    Args:
+        interface_name: Connection name (e.g. "Wi-Fi") or adapter description.
+
+    Returns:
+        Dictionary with ssid, mac_address, quality, rx_rate, tx_rate and channel
+        keys, or an empty dictionary if the interface is not connected.
+
+    Raises:
+        OSError: If the Native Wifi API is unavailable or a call fails.
+    """
+    wlanapi, iphlpapi, client_handle = _open_session()
+
+    interface_list = ctypes.POINTER(WLAN_INTERFACE_INFO_LIST)()
+    try:
+        _check(wlanapi.WlanEnumInterfaces(client_handle, None, ctypes.byref(interface_list)),
+               "WlanEnumInterfaces")
+
+        count = interface_list.contents.dwNumberOfItems
+        interfaces = ctypes.cast(
+            interface_list.contents.InterfaceInfo,
+            ctypes.POINTER(WLAN_INTERFACE_INFO * count)
+        ).contents
+
+        interface = _select_interface(iphlpapi, list(interfaces), interface_name)
+        if interface is None or interface.isState != WLAN_INTERFACE_STATE_CONNECTED:
+            return {}
+
+        guid = interface.InterfaceGuid
+        return _query_connection(wlanapi, client_handle, guid)
+
+    except OSError:
+        # Drop a possibly stale handle (e.g. WLAN service restart) so the
+        # next query reopens it.
+        close()
+        raise
+
+    finally:
+        if interface_list:
+            wlanapi.WlanFreeMemory(interface_list)
+
+
+def _query_connection(wlanapi: Any, client_handle: ctypes.c_void_p, guid: GUID) -> Dict[str, Any]:
+    """Read connection attributes and channel for one interface.
+
+    Args:
+        wlanapi: Loaded wlanapi library.
+        client_handle: Open WLAN client handle.
+        guid: Interface GUID.
+
+    Returns:
+        Dictionary with connection information.
+    """
+    data_size = ctypes.c_uint32()
+    data = ctypes.c_void_p()
+    _check(wlanapi.WlanQueryInterface(client_handle, ctypes.byref(guid),
+                                      WLAN_INTF_OPCODE_CURRENT_CONNECTION, None,
+                                      ctypes.byref(data_size), ctypes.byref(data), None),
+           "WlanQueryInterface")
+    try:
+        attributes = ctypes.cast(data, ctypes.POINTER(WLAN_CONNECTION_ATTRIBUTES)).contents
+        association = attributes.wlanAssociationAttributes
+        ssid = association.dot11Ssid
+        info = {
+            'ssid': bytes(ssid.ucSSID[:ssid.uSSIDLength]).decode('utf-8', errors='replace'),
+            'mac_address': ':'.join(f"{b:02x}" for b in association.dot11Bssid),
+            'quality': int(association.wlanSignalQuality),
+            'rx_rate': association.ulRxRate / 1000.0,  # kbps -> Mbps
+            'tx_rate': association.ulTxRate / 1000.0,
+        }
+    finally:
+        wlanapi.WlanFreeMemory(data)
+
+    channel = ctypes.c_void_p()
+    if wlanapi.WlanQueryInterface(client_handle, ctypes.byref(guid),
+                                  WLAN_INTF_OPCODE_CHANNEL_NUMBER, None,
+                                  ctypes.byref(data_size), ctypes.byref(channel),
+                                  None) == ERROR_SUCCESS:
+        try:
+            info['channel'] = ctypes.cast(channel, ctypes.POINTER(ctypes.c_uint32)).contents.value
+        finally:
+            wlanapi.WlanFreeMemory(channel)
+
+    return info
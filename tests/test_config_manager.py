@@ -52,6 +52,28 @@ class TestConfigurationManager(unittest.TestCase):
         self.assertIsInstance(config, Configuration)
         self.assertTrue(config.validate())
 
+    def test_load_config_cached(self):
+        """Test reloading an unchanged file returns an independent copy."""
+        manager = ConfigurationManager()
+        manager.create_default_config(str(self.test_config_path))
+        
+        first = ConfigurationManager(str(self.test_config_path)).load_config()
+        first.target_ips.append('10.0.0.1')
+        
+        manager = ConfigurationManager(str(self.test_config_path))
+        second = manager.load_config()
+        
+        self.assertIsNot(first, second)
+        self.assertNotIn('10.0.0.1', second.target_ips)
+        
+        # Parser state is restored, so saving round-trips the file
+        manager.set_config_value('measurement', 'ping_count', '100')
+        manager.save_config()
+        
+        third = ConfigurationManager(str(self.test_config_path)).load_config()
+        self.assertEqual(third.ping_count, 100)
+        self.assertEqual(third.interface_name, second.interface_name)
+
     def test_load_missing_config(self):
         """Test loading non-existent configuration file."""
         manager = ConfigurationManager("nonexistent.ini")
@@ -133,6 +155,17 @@ class TestConfigurationManager(unittest.TestCase):
         self.assertEqual(defaults['interface_name'], 'Wi-Fi')
         self.assertEqual(defaults['ping_count'], 10)
 
+    def test_get_defaults_returns_copy(self):
+        """Test modifying returned defaults does not affect later calls."""
+        manager = ConfigurationManager()
+        defaults = manager.get_defaults()
+        defaults['target_ips'].append('10.0.0.1')
+        defaults['ping_count'] = 99
+        
+        fresh = manager.get_defaults()
+        self.assertEqual(fresh['target_ips'], ['192.168.1.1'])
+        self.assertEqual(fresh['ping_count'], 10)
+
     def test_config_with_missing_sections(self):
         """Test loading config with missing sections uses defaults."""
         # Create minimal config with only network section
@@ -150,6 +183,39 @@ class TestConfigurationManager(unittest.TestCase):
         self.assertEqual(config.ping_count, 10)  # default
         self.assertEqual(config.iperf_port, 5201)  # default
 
+    def test_ini_syntax(self):
+        """Test comments, colon separators and key case are handled like configparser."""
+        with open(self.test_config_path, 'w') as f:
+            f.write('# comment\n')
+            f.write('[network]\n')
+            f.write('; another comment\n')
+            f.write('Interface_Name: Ethernet\n')
+            f.write('timeout = 5\n')
+            f.write('[output]\n')
+            f.write('verbose = yes\n')
+
+        manager = ConfigurationManager(str(self.test_config_path))
+        config = manager.load_config()
+
+        self.assertEqual(config.interface_name, 'Ethernet')
+        self.assertEqual(config.timeout, 5)
+        self.assertTrue(config.verbose)
+
+    def test_invalid_ini_syntax(self):
+        """Test malformed files raise configparser errors."""
+        import configparser
+
+        with open(self.test_config_path, 'w') as f:
+            f.write('interface_name = Ethernet\n')
+        with self.assertRaises(configparser.MissingSectionHeaderError):
+            ConfigurationManager(str(self.test_config_path)).load_config()
+
+        with open(self.test_config_path, 'w') as f:
+            f.write('[network]\n')
+            f.write('not an option\n')
+        with self.assertRaises(configparser.ParsingError):
+            ConfigurationManager(str(self.test_config_path)).load_config()
+
     def test_boolean_parsing(self):
         """Test parsing boolean values from config."""
         manager = ConfigurationManager()
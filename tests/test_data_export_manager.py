@@ -8,7 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, mock_open, MagicMock
 
-from src.data_export_manager import DataExportManager
+from src.data_export_manager import CSV_HEADERS, DataExportManager, _project_row
 from src.models import (
     MeasurementResult, 
     WiFiInfo, 
@@ -94,6 +94,7 @@ class TestDataExportManager(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test fixtures."""
+        self.manager.close()
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
@@ -123,6 +124,13 @@ class TestDataExportManager(unittest.TestCase):
         for header in expected_headers:
             self.assertIn(header, headers)
     
+    def test_project_row(self):
+        """Test rows are projected onto CSV_HEADERS order with None for missing fields."""
+        row = self.measurement.to_csv_row()
+        
+        self.assertEqual(_project_row(row), tuple(row.get(h) for h in CSV_HEADERS))
+        self.assertEqual(_project_row({}), (None,) * len(CSV_HEADERS))
+    
     def test_initialize_csv_file_new(self):
         """Test CSV file initialization for new file."""
         file_path = Path(self.temp_dir) / "test_new.csv"
@@ -173,6 +181,16 @@ class TestDataExportManager(unittest.TestCase):
             headers = next(reader)
             self.assertEqual(headers, self.manager.csv_headers)
     
+    def test_initialize_csv_file_creates_parent(self):
+        """Test CSV file initialization creates missing parent directories."""
+        file_path = Path(self.temp_dir) / "nested" / "dir" / "test_init.csv"
+        
+        result = self.manager.initialize_csv_file(file_path)
+        
+        self.assertTrue(result)
+        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+            self.assertEqual(next(csv.reader(csvfile)), self.manager.csv_headers)
+    
     @patch('src.data_export_manager.logger')
     def test_initialize_csv_file_error(self, mock_logger):
         """Test CSV file initialization error handling."""
@@ -258,6 +276,24 @@ class TestDataExportManager(unittest.TestCase):
             self.assertEqual(len(rows), 1)
             self.assertEqual(rows[0]['measurement_id'], 'test_001')
     
+    def test_write_measurement_reuses_handle(self):
+        """Test appends keep one file handle open until close()."""
+        file_path = Path(self.temp_dir) / "test_reuse.csv"
+        
+        with patch('builtins.open', wraps=open) as mock_file:
+            self.manager.write_measurement(file_path, self.measurement)
+            self.manager.write_measurement(file_path, self.measurement)
+        
+        self.assertEqual(mock_file.call_count, 1)
+        
+        # Rows are flushed on every write, before close()
+        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        self.assertEqual(len(rows), 2)
+        
+        self.manager.close()
+        self.assertEqual(self.manager._open_files, {})
+    
     @patch('src.data_export_manager.logger')
     def test_write_measurement_error(self, mock_logger):
         """Test write measurement error handling."""
@@ -351,6 +387,36 @@ class TestDataExportManager(unittest.TestCase):
             rows = list(reader)
             self.assertEqual(len(rows), 3)  # 1 initial + 2 batch
     
+    def test_write_measurements_batch_append_to_nonexistent(self):
+        """Test batch append creates the file and directory with one header row."""
+        file_path = Path(self.temp_dir) / "nested" / "test_batch_new.csv"
+        
+        self.manager.write_measurements_batch(file_path, [self.measurement], append=True)
+        self.manager.write_measurements_batch(file_path, [self.measurement], append=True)
+        
+        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1]['measurement_id'], 'test_001')
+    
+    def test_write_measurements_batch_generator(self):
+        """Test batch write streams measurements from a generator."""
+        file_path = Path(self.temp_dir) / "test_batch_generator.csv"
+        measurements = (
+            MeasurementResult(measurement_id=f"gen_{i:03d}", wifi_info=self.wifi_info)
+            for i in range(3)
+        )
+        
+        written_count = self.manager.write_measurements_batch(file_path, measurements, append=False)
+        
+        self.assertEqual(written_count, 3)
+        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        self.assertEqual([row['measurement_id'] for row in rows], ['gen_000', 'gen_001', 'gen_002'])
+        
+        # An empty generator writes nothing
+        self.assertEqual(self.manager.write_measurements_batch(file_path, iter([])), 0)
+    
     @patch('src.data_export_manager.logger')
     def test_write_measurements_batch_partial_failure(self, mock_logger):
         """Test batch write with some measurements failing."""
@@ -3,6 +3,7 @@
 import unittest
 import socket
 import subprocess
+import sys
 import tempfile
 import os
 from unittest.mock import Mock, patch, MagicMock
@@ -15,6 +16,14 @@ from src.error_handler import (
 )
 
 
+class PickleSubclassError(WLANAnalyzerError):
+    """Subclass without __slots__, keeping its own attribute in __dict__."""
+
+    def __init__(self, message: str, extra=None, **kwargs):
+        super().__init__(message, component="tester", **kwargs)
+        self.extra = extra
+
+
 class TestErrorClasses(unittest.TestCase):
     """Test custom error classes."""
 
@@ -52,6 +61,42 @@ class TestErrorClasses(unittest.TestCase):
         self.assertEqual(error_dict['severity'], "high")
         self.assertIn('timestamp', error_dict)
 
+    def test_wlan_analyzer_error_message_args(self):
+        """Test message templates are formatted when the error is converted to text."""
+        error = NetworkError("Network timeout in %s during %s: %s",
+                             message_args=("scanner", "ping", "timed out"))
+        
+        self.assertEqual(str(error), "Network timeout in scanner during ping: timed out")
+        self.assertEqual(error.to_dict()['message'], str(error))
+        self.assertEqual(error.args, ("Network timeout in scanner during ping: timed out",))
+        self.assertEqual(repr(error),
+                         "NetworkError('Network timeout in scanner during ping: timed out')")
+
+    def test_wlan_analyzer_error_pickle(self):
+        """Test errors keep their attributes through a pickle round trip."""
+        import pickle
+        
+        error = NetworkError("Network timeout in %s during %s: %s",
+                             message_args=("scanner", "ping", "timed out"),
+                             severity=ErrorSeverity.LOW,
+                             additional_info={"key": "value"})
+        restored = pickle.loads(pickle.dumps(error))
+        
+        self.assertIsInstance(restored, NetworkError)
+        self.assertEqual(restored.to_dict(), error.to_dict())
+        self.assertEqual(error.__dict__, {})
+
+    def test_wlan_analyzer_error_pickle_subclass_attributes(self):
+        """Test attributes set by subclasses survive a pickle round trip."""
+        import pickle
+        
+        error = PickleSubclassError("Subclass error", extra=5)
+        restored = pickle.loads(pickle.dumps(error))
+        
+        self.assertEqual(restored.extra, 5)
+        self.assertEqual(restored.component, "tester")
+        self.assertEqual(str(restored), "Subclass error")
+
     def test_network_error(self):
         """Test NetworkError automatic error type setting."""
         error = NetworkError("Network test error")
@@ -180,6 +225,16 @@ class TestErrorHandler(unittest.TestCase):
         self.assertIsInstance(result, FileSystemError)
         self.assertEqual(result.severity, ErrorSeverity.HIGH)
 
+    def test_high_severity_logs_original_exception(self):
+        """Test high severity errors log the handled exception as exc_info."""
+        perm_error = PermissionError("Permission denied")
+        
+        with patch.object(self.handler.logger, 'error') as mock_log:
+            self.handler.handle_file_system_error(perm_error)
+        
+        mock_log.assert_called_once()
+        self.assertIs(mock_log.call_args[1]['exc_info'], perm_error)
+
     def test_handle_disk_full_error(self):
         """Test handling disk full errors."""
         # Create OSError with errno 28 (No space left on device)
@@ -247,6 +302,23 @@ class TestErrorHandler(unittest.TestCase):
         # Check counts
         self.assertEqual(self.handler.error_counts[ErrorType.NETWORK_ERROR], 2)
 
+    def test_error_counting_concurrent(self):
+        """Test counts and history stay consistent across threads."""
+        import threading
+        
+        def worker():
+            for _ in range(200):
+                self.handler.handle_network_error(socket.timeout(), "test", "test")
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(self.handler.error_counts[ErrorType.NETWORK_ERROR], 800)
+        self.assertEqual(self.handler.get_error_statistics()['history_size'], 800)
+
     def test_error_history(self):
         """Test error history tracking."""
         # Initially empty
@@ -415,6 +487,20 @@ class TestErrorContext(unittest.TestCase):
         self.assertEqual(context.additional_info["test"], "value")
 
 
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_error_context_slots(self):
+        """Test ErrorContext uses slots instead of an instance dict."""
+        context = ErrorContext(
+            error_type=ErrorType.NETWORK_ERROR,
+            severity=ErrorSeverity.LOW,
+            component="test",
+            operation="test_op",
+            timestamp=datetime.now(),
+            additional_info={}
+        )
+        
+        self.assertFalse(hasattr(context, '__dict__'))
+
 class TestErrorHandlerIntegration(unittest.TestCase):
     """Integration tests for error handler."""
 
@@ -489,6 +575,37 @@ class TestErrorHandlerIntegration(unittest.TestCase):
         self.assertEqual(stats['total_errors'], 2)
         self.assertEqual(stats['recent_errors'], 1)  # Only recent error counts
 
+    def test_recent_errors_ignores_days_old_errors(self):
+        """Test errors more than a day old are not counted as recent."""
+        context = ErrorContext(
+            error_type=ErrorType.NETWORK_ERROR,
+            severity=ErrorSeverity.LOW,
+            component="test",
+            operation="test",
+            timestamp=datetime.now() - timedelta(days=1, minutes=10),
+            additional_info={}
+        )
+        self.handler.error_history.append(context)
+        
+        stats = self.handler.get_error_statistics()
+        self.assertEqual(stats['recent_errors'], 0)
+
+
+    def test_recent_errors_expire(self):
+        """Test recorded errors stop counting as recent after an hour."""
+        import time
+        
+        self.handler.handle_network_error(socket.timeout(), "test", "test")
+        self.assertEqual(self.handler.get_error_statistics()['recent_errors'], 1)
+        
+        later = time.monotonic() + 3601
+        with patch('src.error_handler.time.monotonic', return_value=later):
+            stats = self.handler.get_error_statistics()
+        
+        self.assertEqual(stats['recent_errors'], 0)
+        self.assertEqual(stats['history_size'], 1)
+        self.assertEqual(stats['latest_error']['component'], "test")
+
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -12,11 +12,13 @@ from datetime import datetime
 from io import StringIO
 import sys
 import argparse
+import logging
+import logging.handlers
 
 # Import the main application and related classes
 from main import MainApplication, ApplicationState
 from src.config_manager import ConfigurationManager
-from src.measurement_orchestrator import MeasurementOrchestrator, OrchestrationResult
+from src.measurement_orchestrator import MeasurementOrchestrator, MeasurementStatus, OrchestrationResult
 from src.models import Configuration, MeasurementType, MeasurementResult
 
 
@@ -50,6 +52,15 @@ class TestApplicationState:
         assert state.measurement_count == 5
         assert state.start_time == start_time
         assert state.last_measurement_time == start_time
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_application_state_slots(self):
+        """Test ApplicationState uses slots instead of an instance dict."""
+        state = ApplicationState()
+        
+        assert not hasattr(state, '__dict__')
+        with pytest.raises(AttributeError):
+            state.unknown_field = True
 
 
 class TestMainApplication:
@@ -95,7 +106,7 @@ class TestMainApplication:
         result = Mock(spec=OrchestrationResult)
         result.measurement_id = "test-measurement-id"
         result.execution_time = 5.0
-        result.step_results = {MeasurementType.PING: Mock(value="completed")}
+        result.step_results = {MeasurementType.PING: MeasurementStatus.COMPLETED}
         result.errors = []
         result.warnings = []
         
@@ -130,6 +141,53 @@ class TestMainApplication:
             finally:
                 os.unlink(tmp_file.name)
     
+    def test_setup_logging_file_buffered(self, app):
+        """Test file log records are buffered and written on cleanup."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, "scanner.log")
+            app.setup_logging(log_level="DEBUG", log_file=log_file)
+            
+            app.logger.debug("buffered record")
+            with open(log_file) as f:
+                assert "buffered record" not in f.read()
+            
+            app.cleanup()
+            with open(log_file) as f:
+                assert "buffered record" in f.read()
+            
+            # Release the file before the directory is removed
+            app.setup_logging(log_level="INFO")
+    
+    def test_setup_logging_file_flush_interval(self, app):
+        """Test buffered file records are written once the flush interval has passed."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, "scanner.log")
+            with patch('main._LOG_FLUSH_INTERVAL', 0.0):
+                app.setup_logging(log_level="DEBUG", log_file=log_file)
+            
+            app.logger.debug("first record")
+            app._stop_log_listener()  # Drain the queue to the buffer
+            with open(log_file) as f:
+                assert "first record" in f.read()
+            
+            app.setup_logging(log_level="INFO")
+    
+    def test_logging_after_cleanup(self, app):
+        """Test records logged after cleanup still reach the handlers."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, "scanner.log")
+            app.setup_logging(log_level="DEBUG", log_file=log_file)
+            app.cleanup()
+            
+            root_handlers = logging.getLogger().handlers
+            assert not any(isinstance(h, logging.handlers.QueueHandler) for h in root_handlers)
+            
+            app.logger.error("late record")  # ERROR flushes the file buffer
+            with open(log_file) as f:
+                assert "late record" in f.read()
+            
+            app.setup_logging(log_level="INFO")
+    
     def test_setup_logging_invalid_level(self, app):
         """Test logging setup with invalid level falls back to INFO."""
         app.setup_logging(log_level="INVALID")
@@ -269,7 +327,7 @@ class TestMainApplication:
         # Verify quiet mode override
         assert mock_config.log_level == "WARNING"
     
-    @patch('main.MeasurementOrchestrator')
+    @patch('src.measurement_orchestrator.MeasurementOrchestrator')
     def test_initialize_orchestrator(self, mock_orchestrator_class, app, mock_config):
         """Test orchestrator initialization."""
         app.configuration = mock_config
@@ -359,6 +417,22 @@ class TestMainApplication:
         # Should still create sequence with valid tests
         mock_orchestrator.create_custom_sequence.assert_called()
     
+    def test_create_measurement_sequence_trailing_comma(self, app, mock_orchestrator):
+        """Test blank entries in the test list are ignored."""
+        app.measurement_orchestrator = mock_orchestrator
+        app.logger = Mock()
+        mock_orchestrator.create_custom_sequence.return_value = Mock(steps=[])
+        
+        args = Mock()
+        args.tests = "ping, ,iperf_tcp,"
+        args.timeout = None
+        
+        app.create_measurement_sequence(args)
+        
+        app.logger.warning.assert_not_called()
+        enabled_measurements = mock_orchestrator.create_custom_sequence.call_args[1]['enabled_measurements']
+        assert enabled_measurements == {MeasurementType.PING, MeasurementType.IPERF_TCP}
+    
     def test_validate_prerequisites_success(self, app, mock_orchestrator):
         """Test successful prerequisites validation."""
         app.measurement_orchestrator = mock_orchestrator
@@ -410,7 +484,7 @@ class TestMainApplication:
         mock_result = Mock()
         mock_result.measurement_id = "test-id"
         mock_result.execution_time = 5.0
-        mock_result.step_results = {MeasurementType.PING: Mock(value="completed")}
+        mock_result.step_results = {MeasurementType.PING: MeasurementStatus.COMPLETED}
         mock_result.errors = []
         mock_result.warnings = []
         
@@ -436,7 +510,7 @@ class TestMainApplication:
         mock_result = Mock()
         mock_result.measurement_id = "test-id"
         mock_result.execution_time = 5.0
-        mock_result.step_results = {MeasurementType.PING: Mock(value="failed")}
+        mock_result.step_results = {MeasurementType.PING: MeasurementStatus.FAILED}
         mock_result.errors = ["Ping failed", "Network error"]
         mock_result.warnings = ["High latency detected"]
         
@@ -455,6 +529,8 @@ class TestMainApplication:
         assert any("Ping failed" in msg for msg in error_calls)
         assert any("Network error" in msg for msg in error_calls)
         assert any("High latency detected" in msg for msg in warning_calls)
+        
+        app.logger.info.assert_any_call("Steps completed: %d/%d", 0, 1)
     
     def test_run_single_measurement_exception(self, app, mock_orchestrator):
         """Test single measurement with exception."""
@@ -562,17 +638,40 @@ class TestMainApplication:
         # Sleep is called in chunks, so verify it was called
         mock_sleep.assert_called()
     
+    def test_run_continuous_measurements_shutdown_wakes_sleep(self, app, mock_orchestrator):
+        """Test a shutdown request ends the wait between measurements."""
+        app.measurement_orchestrator = mock_orchestrator
+        app.logger = Mock()
+        app.run_single_measurement = Mock(return_value=True)
+        
+        # Shutdown arrives while the loop would be sleeping
+        app._shutdown_event.set()
+        
+        start = time.monotonic()
+        app.run_continuous_measurements(Mock(), interval=60)
+        
+        assert time.monotonic() - start < 5
+        app.run_single_measurement.assert_called_once()
+    
     def test_signal_handler_first_signal(self, app):
         """Test signal handler on first signal."""
         app.logger = Mock()
         app.state.shutdown_requested = False
         
         # Test SIGINT
-        app._signal_handler(signal.SIGINT, None)
+        with patch('main.os.write') as mock_write:
+            app._signal_handler(signal.SIGINT, None)
         
         assert app.state.shutdown_requested is True
         assert app.state.running is False
-        app.logger.info.assert_called()
+        assert app._shutdown_event.is_set()
+        mock_write.assert_called_once()
+        
+        # Logging is deferred until cleanup, outside the signal handler
+        app.logger.info.assert_not_called()
+        app.cleanup()
+        info_calls = [call[0][0] for call in app.logger.info.call_args_list]
+        assert any("SIGINT received" in msg for msg in info_calls)
     
     def test_signal_handler_second_signal(self, app):
         """Test signal handler on second signal."""
@@ -580,11 +679,12 @@ class TestMainApplication:
         app.state.shutdown_requested = True  # Already requested
         
         # Test second signal - should force exit
-        with pytest.raises(SystemExit) as exc_info:
-            app._signal_handler(signal.SIGINT, None)
+        with patch('main.os.write') as mock_write:
+            with pytest.raises(SystemExit) as exc_info:
+                app._signal_handler(signal.SIGINT, None)
         
         assert exc_info.value.code == 1
-        app.logger.warning.assert_called()
+        mock_write.assert_called_once()
     
     def test_print_summary(self, app):
         """Test print summary functionality."""
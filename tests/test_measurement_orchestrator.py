@@ -179,6 +179,7 @@ class TestMeasurementOrchestrator:
         assert sequence.continue_on_failure is True
         assert sequence.export_results is True
         assert sequence.cleanup_on_exit is True
+        assert sequence.prerequisite_check_interval == 1
         
         # Check all measurement types are included
         measurement_types = [step.measurement_type for step in sequence.steps]
@@ -293,6 +294,32 @@ class TestMeasurementOrchestrator:
         assert len(result.errors) > 0
         assert len(result.step_results) == 0  # No steps executed
 
+    def test_execute_measurement_cycle_prerequisite_check_interval(self, orchestrator, mock_wifi_collector):
+        """Test prerequisites are re-validated only every N cycles after passing."""
+        sequence = MeasurementSequence(
+            steps=[
+                MeasurementStep(
+                    measurement_type=MeasurementType.WIFI_INFO,
+                    enabled=True
+                )
+            ],
+            prerequisite_check_interval=3
+        )
+        
+        for _ in range(7):
+            orchestrator.execute_measurement_cycle(sequence)
+        
+        # Cycles 1, 4 and 7 validate
+        assert mock_wifi_collector.is_connected.call_count == 3
+        
+        # Once a check fails (cycle 10), every following cycle validates
+        mock_wifi_collector.is_connected.reset_mock()
+        mock_wifi_collector.is_connected.return_value = False
+        for _ in range(5):
+            orchestrator.execute_measurement_cycle(sequence)
+        
+        assert mock_wifi_collector.is_connected.call_count == 3
+
     def test_execute_measurement_cycle_step_failure_with_skip(self, orchestrator, mock_wifi_collector):
         """Test measurement cycle with step failure but skip on error."""
         mock_wifi_collector.collect_wifi_info.side_effect = Exception("WiFi collection failed")
@@ -526,11 +553,12 @@ class TestMeasurementOrchestrator:
         assert 'supported_protocols' in status
         assert 'wifi_connected' in status
 
-    def test_cleanup(self, orchestrator, mock_file_transfer_tester):
+    def test_cleanup(self, orchestrator, mock_file_transfer_tester, mock_data_export_manager):
         """Test orchestrator cleanup."""
         orchestrator.cleanup()
         
         mock_file_transfer_tester.cleanup.assert_called_once()
+        mock_data_export_manager.close.assert_called_once()
 
     def test_cleanup_with_exception(self, orchestrator, mock_file_transfer_tester):
         """Test orchestrator cleanup with exception."""
@@ -708,6 +736,7 @@ class TestMeasurementSequence:
         assert sequence.continue_on_failure is False
         assert sequence.export_results is True
         assert sequence.cleanup_on_exit is True
+        assert sequence.prerequisite_check_interval == 1
 
 
 class TestOrchestrationResult:
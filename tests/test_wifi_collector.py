@@ -1,5 +1,6 @@
 """Unit tests for WiFi information collector."""
 
+import io
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
@@ -7,6 +8,15 @@ from src.wifi_collector import WiFiInfoCollector
 from src.models import WiFiInfo
 
 
+def _mock_netsh(mock_popen, output, returncode=0):
+    """Make a patched subprocess.Popen stream the given netsh output."""
+    proc = MagicMock()
+    proc.stdout = io.BytesIO(output)
+    proc.returncode = returncode
+    mock_popen.return_value.__enter__.return_value = proc
+    return proc
+
+
 class TestWiFiInfoCollector(unittest.TestCase):
     """Test WiFiInfoCollector class."""
 
@@ -64,24 +74,22 @@ class TestWiFiInfoCollector(unittest.TestCase):
         self.assertEqual(self.collector._quality_to_rssi(80), -60)
         self.assertEqual(self.collector._quality_to_rssi(20), -90)
 
-    @patch('subprocess.run')
+    @patch('subprocess.Popen')
     @patch('platform.system')
-    def test_collect_windows_wifi_info(self, mock_platform, mock_run):
+    def test_collect_windows_wifi_info(self, mock_platform, mock_popen):
         """Test Windows WiFi info collection."""
         mock_platform.return_value = "Windows"
         
-        # Mock netsh output
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
+        # Mock netsh output; the trailing profile line is never read
+        proc = _mock_netsh(mock_popen, """
     SSID                   : TestNetwork
     BSSID                  : 00:11:22:33:44:55
     Channel                : 6
     Receive rate (Mbps)    : 150
     Transmit rate (Mbps)   : 150
     Signal                 : 80%
-        """
-        mock_run.return_value = mock_result
+    Profile                : TestNetwork
+        """.encode())
         
         collector = WiFiInfoCollector("Wi-Fi")
         wifi_info = collector.collect_wifi_info()
@@ -90,6 +98,83 @@ class TestWiFiInfoCollector(unittest.TestCase):
         self.assertEqual(wifi_info.ssid, "TestNetwork")
         self.assertEqual(wifi_info.channel, 6)
         self.assertEqual(wifi_info.link_quality, 80)
+        proc.kill.assert_called_once()
+
+    @patch('src.wifi_collector._console_encoding', return_value='cp932')
+    @patch('subprocess.Popen')
+    @patch('platform.system')
+    def test_collect_windows_wifi_info_oem_codepage(self, mock_platform, mock_popen, mock_encoding):
+        """Test Japanese netsh output decoded with the console code page."""
+        mock_platform.return_value = "Windows"
+        
+        _mock_netsh(mock_popen, """
+    SSID                   : テストネットワーク
+    AP BSSID               : 00:11:22:33:44:55
+    チャネル               : 6
+    受信速度 (Mbps)        : 144.4
+    送信速度 (Mbps)        : 72
+    シグナル               : 80%
+        """.encode('cp932'))
+        
+        collector = WiFiInfoCollector("Wi-Fi")
+        wifi_info = collector.collect_wifi_info()
+        
+        self.assertIsNotNone(wifi_info)
+        self.assertEqual(wifi_info.ssid, "テストネットワーク")
+        self.assertEqual(wifi_info.mac_address, "00:11:22:33:44:55")
+        self.assertEqual(wifi_info.channel, 6)
+        self.assertEqual(wifi_info.rx_rate, 144.4)
+        self.assertEqual(wifi_info.tx_rate, 72.0)
+        self.assertEqual(wifi_info.link_quality, 80)
+
+    @patch('src.wifi_collector.wlanapi.query_interface')
+    @patch('src.wifi_collector.wlanapi.AVAILABLE', True)
+    @patch('subprocess.Popen')
+    @patch('platform.system')
+    def test_collect_windows_wifi_info_native(self, mock_platform, mock_popen, mock_query):
+        """Test Windows WiFi info collection through the Native Wifi API."""
+        mock_platform.return_value = "Windows"
+        mock_query.return_value = {
+            'ssid': 'TestNetwork',
+            'mac_address': '00:11:22:33:44:55',
+            'quality': 80,
+            'rx_rate': 150.0,
+            'tx_rate': 150.0,
+            'channel': 6,
+        }
+        
+        collector = WiFiInfoCollector("Wi-Fi")
+        wifi_info = collector.collect_wifi_info()
+        
+        self.assertIsNotNone(wifi_info)
+        self.assertEqual(wifi_info.ssid, "TestNetwork")
+        self.assertEqual(wifi_info.channel, 6)
+        self.assertEqual(wifi_info.link_quality, 80)
+        self.assertEqual(wifi_info.rssi, -60)
+        mock_query.assert_called_once_with("Wi-Fi")
+        mock_popen.assert_not_called()
+
+    @patch('src.wifi_collector.wlanapi.query_interface')
+    @patch('src.wifi_collector.wlanapi.AVAILABLE', True)
+    @patch('subprocess.Popen')
+    @patch('platform.system')
+    def test_collect_windows_wifi_info_native_fallback(self, mock_platform, mock_popen, mock_query):
+        """Test fallback to netsh when the Native Wifi API fails."""
+        mock_platform.return_value = "Windows"
+        mock_query.side_effect = OSError("wlanapi.dll not found")
+        
+        _mock_netsh(mock_popen, """
+    SSID                   : TestNetwork
+    Channel                : 6
+    Signal                 : 80%
+        """.encode())
+        
+        collector = WiFiInfoCollector("Wi-Fi")
+        wifi_info = collector.collect_wifi_info()
+        
+        self.assertIsNotNone(wifi_info)
+        self.assertEqual(wifi_info.ssid, "TestNetwork")
+        mock_popen.assert_called()
 
     @patch('subprocess.run')
     @patch('platform.system')
@@ -168,6 +253,35 @@ lastAssocStatus: 0
         self.assertEqual(wifi_info.channel, 6)
         self.assertEqual(wifi_info.tx_rate, 150.0)
 
+    @patch('subprocess.run')
+    @patch('platform.system')
+    def test_collect_wifi_info_cached(self, mock_platform, mock_run):
+        """Test repeated collection within the TTL reuses the last reading."""
+        mock_platform.return_value = "Darwin"
+        
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = """
+     agrCtlRSSI: -60
+           SSID: TestNetwork
+        channel: 6
+        """
+        mock_run.return_value = mock_result
+        
+        collector = WiFiInfoCollector("en0", cache_ttl=60.0)
+        first = collector.collect_wifi_info()
+        second = collector.collect_wifi_info()
+        
+        self.assertIsNotNone(first)
+        self.assertIs(first, second)
+        self.assertEqual(mock_run.call_count, 1)
+        
+        # Caching disabled: every call queries the platform tools
+        collector = WiFiInfoCollector("en0", cache_ttl=0)
+        collector.collect_wifi_info()
+        collector.collect_wifi_info()
+        self.assertEqual(mock_run.call_count, 3)
+
     @patch('subprocess.run')
     @patch('platform.system')
     def test_get_available_interfaces_windows(self, mock_platform, mock_run):
@@ -184,7 +298,7 @@ Physical address       : 00:11:22:33:44:55
 
 Name                   : Wi-Fi 2
 Description            : Realtek 8822CE Wireless LAN 802.11ac PCI-E NIC
-        """
+        """.encode()
         mock_run.return_value = mock_result
         
         collector = WiFiInfoCollector()
@@ -240,21 +354,25 @@ Description            : Realtek 8822CE Wireless LAN 802.11ac PCI-E NIC
         
         self.assertFalse(self.collector.is_connected())
 
-    @patch('subprocess.run')
+    @patch('src.wifi_collector.wlanapi.AVAILABLE', False)
+    @patch('subprocess.Popen')
     @patch('platform.system')
-    def test_collect_wifi_info_error_handling(self, mock_platform, mock_run):
+    def test_collect_wifi_info_error_handling(self, mock_platform, mock_popen):
         """Test error handling in WiFi info collection."""
         mock_platform.return_value = "Windows"
         
-        # Mock command failure
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Network interface not found"
-        mock_run.return_value = mock_result
+        # netsh reports the failure as a plain sentence and a non-zero exit code
+        _mock_netsh(mock_popen, b"There is no such wireless interface on the system.\r\n",
+                    returncode=1)
         
-        wifi_info = self.collector.collect_wifi_info()
+        collector = WiFiInfoCollector("Wi-Fi")
+        with self.assertLogs('src.wifi_collector', level='ERROR') as logs:
+            wifi_info = collector.collect_wifi_info()
         
         self.assertIsNone(wifi_info)
+        mock_popen.assert_called_once()
+        self.assertIn("netsh command failed: There is no such wireless interface on the system.",
+                      logs.output[0])
 
     def test_unsupported_platform(self):
         """Test handling of unsupported platform."""